@@ -13,17 +13,27 @@ import pandas as pd
 import numpy as np
 import json
 import os
+import io
+import re
+import sqlite3
+import threading
+from contextlib import closing
 from datetime import datetime, timedelta
+from types import MappingProxyType
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import plotly.express as px
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 # ══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ══════════════════════════════════════════════════════════════════════════
 
-# Available tickers with detailed information
-TICKERS = {
+# Available tickers with detailed information (read-only)
+TICKERS = MappingProxyType({
     "AAPL": {"name": "Apple Inc.", "sector": "Technology", "emoji": "🍎"},
     "MSFT": {"name": "Microsoft Corp.", "sector": "Technology", "emoji": "💻"},
     "GOOGL": {"name": "Alphabet Inc.", "sector": "Technology", "emoji": "🔍"},
@@ -34,7 +44,33 @@ TICKERS = {
     "JPM": {"name": "JPMorgan Chase", "sector": "Financial Services", "emoji": "🏦"},
     "V": {"name": "Visa Inc.", "sector": "Financial Services", "emoji": "💳"},
     "JNJ": {"name": "Johnson & Johnson", "sector": "Healthcare", "emoji": "🏥"},
-}
+})
+
+@st.cache_resource
+def _ticker_registry():
+    """Immutable (ticker, info) pairs and ticker keys, built once per server process"""
+    return tuple(TICKERS.items()), tuple(TICKERS)
+
+TICKER_ITEMS, TICKER_KEYS = _ticker_registry()
+
+# Only the end of a log is parsed: the latest-prediction views read a small
+# window, the analytics page a larger one
+LATEST_TAIL_BYTES = 64 * 1024
+LOG_TAIL_BYTES = 2_000_000
+
+# Leading bytes of a JSONL log compared between reads to detect a replaced file
+LOG_HEAD_BYTES = 256
+
+# Columns read from the Parquet log partitions (the ticker is implied by the directory)
+LOG_COLUMNS = ['timestamp', 'current_price', 'predicted_price', 'price_change',
+               'price_change_pct', 'rsi', 'macd']
+
+# Fields of a JSONL log entry and its timestamp format (as written by the monitor)
+LOG_RECORD_KEYS = ['timestamp', 'ticker'] + LOG_COLUMNS[1:]
+LOG_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Upper bound on points per time-series trace sent to the browser
+MAX_PLOT_POINTS = 2000
 
 # ══════════════════════════════════════════════════════════════════════════
 # PAGE CONFIGURATION
@@ -47,103 +83,107 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for enhanced UI
-st.markdown("""
-<style>
-    /* Main headers */
-    .main-header {
-        font-size: 3rem;
-        font-weight: bold;
-        background: linear-gradient(90deg, #1f77b4, #2ca02c);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        text-align: center;
-        padding: 1rem 0;
-    }
-    
-    .sub-header {
-        font-size: 1.3rem;
-        color: #666;
-        text-align: center;
-        padding-bottom: 1.5rem;
-    }
-    
-    /* Ticker badges */
-    .ticker-badge {
-        display: inline-block;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 8px 16px;
-        border-radius: 25px;
-        font-weight: bold;
-        font-size: 1.1rem;
-        margin: 5px;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-    }
-    
-    /* Metric cards */
-    .metric-card {
-        background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-        padding: 1.5rem;
-        border-radius: 15px;
-        box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-        margin: 10px 0;
-    }
-    
-    /* Signal indicators */
-    .signal-buy {
-        background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
-        color: white;
-        padding: 10px 20px;
-        border-radius: 20px;
-        font-weight: bold;
-        display: inline-block;
-    }
-    
-    .signal-sell {
-        background: linear-gradient(135deg, #eb3349 0%, #f45c43 100%);
-        color: white;
-        padding: 10px 20px;
-        border-radius: 20px;
-        font-weight: bold;
-        display: inline-block;
-    }
-    
-    .signal-hold {
-        background: linear-gradient(135deg, #FFB75E 0%, #ED8F03 100%);
-        color: white;
-        padding: 10px 20px;
-        border-radius: 20px;
-        font-weight: bold;
-        display: inline-block;
-    }
-    
-    /* Info boxes */
-    .info-box {
-        background: #e3f2fd;
-        border-left: 5px solid #2196f3;
-        padding: 15px;
-        margin: 10px 0;
-        border-radius: 5px;
-    }
-    
-    .warning-box {
-        background: #fff3e0;
-        border-left: 5px solid #ff9800;
-        padding: 15px;
-        margin: 10px 0;
-        border-radius: 5px;
-    }
-    
-    .success-box {
-        background: #e8f5e9;
-        border-left: 5px solid #4caf50;
-        padding: 15px;
-        margin: 10px 0;
-        border-radius: 5px;
-    }
-</style>
-""", unsafe_allow_html=True)
+@st.cache_resource
+def _inject_css():
+    """Custom CSS for enhanced UI, built once per server process"""
+    return """
+    <style>
+        /* Main headers */
+        .main-header {
+            font-size: 3rem;
+            font-weight: bold;
+            background: linear-gradient(90deg, #1f77b4, #2ca02c);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+            text-align: center;
+            padding: 1rem 0;
+        }
+    
+        .sub-header {
+            font-size: 1.3rem;
+            color: #666;
+            text-align: center;
+            padding-bottom: 1.5rem;
+        }
+    
+        /* Ticker badges */
+        .ticker-badge {
+            display: inline-block;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 8px 16px;
+            border-radius: 25px;
+            font-weight: bold;
+            font-size: 1.1rem;
+            margin: 5px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+        }
+    
+        /* Metric cards */
+        .metric-card {
+            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+            padding: 1.5rem;
+            border-radius: 15px;
+            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+            margin: 10px 0;
+        }
+    
+        /* Signal indicators */
+        .signal-buy {
+            background: linear-gradient(135deg, #11998e 0%, #38ef7d 100%);
+            color: white;
+            padding: 10px 20px;
+            border-radius: 20px;
+            font-weight: bold;
+            display: inline-block;
+        }
+    
+        .signal-sell {
+            background: linear-gradient(135deg, #eb3349 0%, #f45c43 100%);
+            color: white;
+            padding: 10px 20px;
+            border-radius: 20px;
+            font-weight: bold;
+            display: inline-block;
+        }
+    
+        .signal-hold {
+            background: linear-gradient(135deg, #FFB75E 0%, #ED8F03 100%);
+            color: white;
+            padding: 10px 20px;
+            border-radius: 20px;
+            font-weight: bold;
+            display: inline-block;
+        }
+    
+        /* Info boxes */
+        .info-box {
+            background: #e3f2fd;
+            border-left: 5px solid #2196f3;
+            padding: 15px;
+            margin: 10px 0;
+            border-radius: 5px;
+        }
+    
+        .warning-box {
+            background: #fff3e0;
+            border-left: 5px solid #ff9800;
+            padding: 15px;
+            margin: 10px 0;
+            border-radius: 5px;
+        }
+    
+        .success-box {
+            background: #e8f5e9;
+            border-left: 5px solid #4caf50;
+            padding: 15px;
+            margin: 10px 0;
+            border-radius: 5px;
+        }
+    </style>
+    """
+
+st.markdown(_inject_css(), unsafe_allow_html=True)
 
 # ══════════════════════════════════════════════════════════════════════════
 # HELPER FUNCTIONS
@@ -162,97 +202,446 @@ def get_file_paths(ticker):
         'model': f'models/{ticker}_model.pkl',
         'scaler': f'models/{ticker}_scaler.pkl',
         'metadata': f'models/{ticker}_model_metadata.json',
-        'log': f'logs/{ticker}_predictions.log'
+        'log': f'logs/{ticker}_predictions.log',
+        'log_dataset': f'logs/{ticker}'
     }
 
+@st.cache_data(ttl=10, show_spinner=False)
+def _dir_listing(directory):
+    """{entry name: mtime} for a directory from one scandir pass, refreshed every few seconds"""
+    try:
+        with os.scandir(directory) as entries:
+            return {e.name: e.stat().st_mtime for e in entries}
+    except OSError:
+        return {}
+
+def _file_mtime(path):
+    """mtime of a file or directory from the cached listing, or None if it doesn't exist"""
+    directory, name = os.path.split(path)
+    return _dir_listing(directory).get(name)
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _read_metadata(path, mtime):
+    """Parse a metadata file; mtime is only part of the cache key"""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
 def load_metadata(ticker):
     """Load model metadata for a ticker"""
     try:
         path = get_file_paths(ticker)['metadata']
-        if os.path.exists(path):
-            with open(path, 'r') as f:
-                return json.load(f)
+        mtime = _file_mtime(path)
+        if mtime is not None:
+            return _read_metadata(path, mtime)
     except:
         pass
     return None
 
-def load_logs(ticker):
-    """Load prediction logs for a ticker"""
+def _read_tail_lines(path, tail_bytes=None):
+    """Return the complete lines in the last tail_bytes of a file"""
+    with open(path, 'rb') as f:
+        if tail_bytes is None:
+            return f.read().splitlines()
+        
+        f.seek(0, os.SEEK_END)
+        start = max(0, f.tell() - tail_bytes)
+        # Read one byte early so a line starting exactly at `start` survives
+        f.seek(max(0, start - 1))
+        data = f.read()
+    
+    if start > 0:
+        data = data[data.find(b'\n') + 1:]
+    return data.splitlines()
+
+def _iter_log_records(lines):
+    """Yield parsed log entries, skipping blank and malformed lines"""
+    for line in lines:
+        if line.strip():
+            try:
+                yield json_loads(line)
+            except ValueError:
+                continue
+
+def _parse_log_lines(lines):
+    """Parse log lines one by one into per-column lists, skipping malformed entries"""
+    columns = {key: [] for key in LOG_RECORD_KEYS}
+    for record in _iter_log_records(lines):
+        if isinstance(record, dict):
+            for key, values in columns.items():
+                values.append(record.get(key))
+    
+    # Keep only fields that actually occur, as a records-based frame would
+    df = pd.DataFrame({key: values for key, values in columns.items()
+                       if any(v is not None for v in values)})
+    if not df.empty:
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format=LOG_TIME_FORMAT, cache=True)
+    return df
+
+def _sort_by_time(df):
+    """Order a log frame by timestamp in place; append-only logs usually already are"""
+    if not df['timestamp'].is_monotonic_increasing:
+        # Stable, so same-second entries keep their logged order
+        df.sort_values('timestamp', inplace=True, kind='mergesort')
+
+def _frame_from_lines(lines):
+    """Build a time-sorted log DataFrame from raw JSONL lines"""
+    try:
+        df = pd.read_json(io.BytesIO(b'\n'.join(lines)), lines=True, convert_dates=['timestamp'])
+    except ValueError:
+        # A single corrupt line fails the bulk parser
+        df = _parse_log_lines(lines)
+    
+    if df.empty:
+        return pd.DataFrame()
+    
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    _sort_by_time(df)
+    return df
+
+def _complete_length(path, size, chunk_size=64 * 1024):
+    """Length of the first size bytes of a file up to and including its last newline"""
+    with open(path, 'rb') as f:
+        end = size
+        while end > 0:
+            start = max(0, end - chunk_size)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b'\n')
+            if newline >= 0:
+                return start + newline + 1
+            end = start
+    return 0
+
+def _read_log_snapshot(path, stat):
+    """Read the complete lines of a log through a Parquet snapshot, rebuilt when the log
+    has changed; returns (bytes parsed, DataFrame)"""
+    snapshot = os.path.splitext(path)[0] + '.parquet'
     try:
-        path = get_file_paths(ticker)['log']
-        if not os.path.exists(path):
-            return pd.DataFrame()
+        # The snapshot carries the mtime of the log it was built from
+        if os.stat(snapshot).st_mtime_ns == stat.st_mtime_ns:
+            return _complete_length(path, stat.st_size), pd.read_parquet(snapshot)
+    except Exception:
+        pass
+    
+    with open(path, 'rb') as f:
+        data = f.read(stat.st_size)
+    # Leave a partially written last line for the next read
+    end = data.rfind(b'\n') + 1
+    df = _frame_from_lines(data[:end].splitlines())
+    if not df.empty:
+        try:
+            df.to_parquet(snapshot, compression='zstd')
+            os.utime(snapshot, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        except Exception:
+            # Read-only checkout or missing Parquet engine: the JSONL log stays authoritative
+            pass
+    return end, df
+
+@st.cache_resource
+def _parsed_logs():
+    """({log path: (file id, bytes parsed, DataFrame)}, lock) shared across reruns and sessions"""
+    return {}, threading.Lock()
+
+def _log_file_id(path, stat, size):
+    """Identify a log file by device, inode and its first bytes (up to LOG_HEAD_BYTES of size)"""
+    with open(path, 'rb') as f:
+        head = f.read(min(size, LOG_HEAD_BYTES))
+    return stat.st_dev, stat.st_ino, head
+
+def _read_log_incremental(path, mtime):
+    """Read a whole log, parsing only the lines appended since the last read"""
+    parsed, lock = _parsed_logs()
+    with lock:
+        # Size first: lines appended while reading are picked up next time
+        stat = os.stat(path)
+        cached = parsed.get(path)
         
-        logs = []
-        with open(path, 'r') as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        logs.append(json.loads(line.strip()))
-                    except:
-                        continue
+        # A log that was truncated, or replaced (rotated) and grown past the old
+        # offset, no longer starts with the bytes parsed before
+        if (cached is None or cached[1] > stat.st_size
+                or _log_file_id(path, stat, cached[1]) != cached[0]):
+            parsed_size, df = _read_log_snapshot(path, stat)
+            parsed[path] = (_log_file_id(path, stat, parsed_size), parsed_size, df)
+            return df
         
-        if not logs:
-            return pd.DataFrame()
+        file_id, parsed_size, df = cached
+        with open(path, 'rb') as f:
+            f.seek(parsed_size)
+            data = f.read(stat.st_size - parsed_size)
+        # Leave a partially written last line for the next read
+        data = data[:data.rfind(b'\n') + 1]
         
-        df = pd.DataFrame(logs)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        return df.sort_values('timestamp')
+        new_rows = _frame_from_lines(data.splitlines())
+        if not new_rows.empty:
+            df = pd.concat([df, new_rows], ignore_index=True) if not df.empty else new_rows
+            _sort_by_time(df)
+        parsed[path] = (file_id, parsed_size + len(data), df)
+        return df
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _read_logs(path, mtime, tail_bytes=None):
+    """Parse a prediction log; mtime is only part of the cache key"""
+    if tail_bytes is None or os.path.getsize(path) <= tail_bytes:
+        return _read_log_incremental(path, mtime)
+    return _frame_from_lines(_read_tail_lines(path, tail_bytes))
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _read_log_dataset(path, mtime):
+    """Read a directory of daily Parquet log partitions; mtime is only part of the cache key"""
+    df = pd.read_parquet(path, engine='pyarrow', columns=LOG_COLUMNS)
+    if df.empty:
+        return pd.DataFrame()
+    _sort_by_time(df)
+    return df
+
+@st.cache_data(ttl=300, max_entries=32, show_spinner=False)
+def _read_latest_partitions(path, mtime, n):
+    """Read the newest daily partitions until they hold at least n rows; mtime is only part of the cache key"""
+    names = sorted(name for name in os.listdir(path) if name.endswith('.parquet'))
+    frames, rows = [], 0
+    for name in reversed(names):
+        frames.append(pd.read_parquet(os.path.join(path, name), engine='pyarrow', columns=LOG_COLUMNS))
+        rows += len(frames[-1])
+        if rows >= n:
+            break
+    
+    if rows == 0:
+        return pd.DataFrame()
+    df = pd.concat(frames[::-1], ignore_index=True)
+    _sort_by_time(df)
+    return df.tail(n)
+
+def load_logs(ticker, tail_bytes=LOG_TAIL_BYTES):
+    """Load prediction logs for a ticker (the last tail_bytes of the file)"""
+    try:
+        paths = get_file_paths(ticker)
+        
+        path = paths['log']
+        mtime = _file_mtime(path)
+        history = _read_logs(path, mtime, tail_bytes) if mtime is not None else pd.DataFrame()
+        
+        # Prefer the columnar per-day partitions written by the monitor
+        dataset_mtime = _file_mtime(paths['log_dataset'])
+        if dataset_mtime is None:
+            return history
+        df = _read_log_dataset(paths['log_dataset'], dataset_mtime)
+        
+        # Predictions logged before the partitions existed live only in the JSONL log
+        if not history.empty:
+            if not df.empty:
+                history = history[history['timestamp'] < df['timestamp'].iloc[0]]
+            if not history.empty:
+                history = history.reindex(columns=LOG_COLUMNS)
+                df = pd.concat([history, df], ignore_index=True) if not df.empty else history
+        return df
     except:
         return pd.DataFrame()
 
+def load_latest_log(ticker, n=1):
+    """Load only the last n predictions for a ticker"""
+    try:
+        # Partitions are per day, so the newest file or two cover the tail
+        dataset = get_file_paths(ticker)['log_dataset']
+        dataset_mtime = _file_mtime(dataset)
+        if dataset_mtime is not None:
+            df = _read_latest_partitions(dataset, dataset_mtime, n)
+            if len(df) >= n:
+                return df
+    except:
+        return pd.DataFrame()
+    # Fewer partitioned rows than asked for: the older ones are in the JSONL log
+    return load_logs(ticker, tail_bytes=LATEST_TAIL_BYTES).tail(n)
+
+def load_logs_bulk(tickers, n=1):
+    """Load the last n predictions for several tickers in one pass"""
+    return {ticker: load_latest_log(ticker, n) for ticker in tickers}
+
+def load_metadata_bulk(tickers):
+    """Load model metadata for several tickers in one pass"""
+    return {ticker: load_metadata(ticker) for ticker in tickers}
+
+SUBSCRIBERS_DB = 'data/subscribers.db'
+# One '@', no whitespace, and a dot in the domain
+_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+# Legacy JSON store, read until the database exists and then imported into it
+SUBSCRIBERS_PATH = 'data/subscribers.json'
+
+SUBSCRIBERS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS subscriptions (
+    email TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    active INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (email, ticker)
+)
+"""
+
+def _empty_subscribers():
+    """Subscriber structure with no emails for any ticker"""
+    return {'emails': {t: set() for t in TICKER_KEYS}}
+
+@st.cache_data(show_spinner=False)
+def _read_subscribers_json(path, mtime):
+    """Parse the legacy subscribers file, each ticker's emails as a set; mtime is only part of the cache key"""
+    with open(path, 'rb') as f:
+        data = json_loads(f.read())
+    # Handle both old and new format
+    if isinstance(data.get('emails'), dict):
+        data['emails'] = {t: set(subs) for t, subs in data['emails'].items()}
+        return data
+    # Convert old format
+    return _empty_subscribers()
+
+@st.cache_data(show_spinner=False)
+def _read_subscribers(path, mtime):
+    """Active subscriptions from the database, each ticker's emails as a set; mtime is only part of the cache key"""
+    data = _empty_subscribers()
+    with closing(sqlite3.connect(path)) as conn:
+        for email, ticker in conn.execute("SELECT email, ticker FROM subscriptions WHERE active = 1"):
+            data['emails'].setdefault(ticker, set()).add(email)
+    return data
+
 def load_subscribers():
-    """Load subscriber list"""
+    """Load subscriber list, with each ticker's emails as a set"""
     try:
-        path = 'data/subscribers.json'
-        if os.path.exists(path):
-            with open(path, 'r') as f:
-                data = json.load(f)
-                # Handle both old and new format
-                if 'emails' in data:
-                    emails = data['emails']
-                    if isinstance(emails, dict):
-                        return data
-                    else:
-                        # Convert old format
-                        return {'emails': {t: [] for t in TICKERS.keys()}}
-                return {'emails': {t: [] for t in TICKERS.keys()}}
+        mtime = _file_mtime(SUBSCRIBERS_DB)
+        if mtime is not None:
+            return _read_subscribers(SUBSCRIBERS_DB, mtime)
+        mtime = _file_mtime(SUBSCRIBERS_PATH)
+        if mtime is not None:
+            return _read_subscribers_json(SUBSCRIBERS_PATH, mtime)
     except:
         pass
-    return {'emails': {t: [] for t in TICKERS.keys()}}
+    return _empty_subscribers()
+
+def _connect_subscribers():
+    """Open the subscriber database, creating it from the legacy JSON file on first use"""
+    os.makedirs('data', exist_ok=True)
+    is_new = not os.path.exists(SUBSCRIBERS_DB)
+    conn = sqlite3.connect(SUBSCRIBERS_DB)
+    if is_new:
+        with conn:
+            conn.execute(SUBSCRIBERS_SCHEMA)
+            if os.path.exists(SUBSCRIBERS_PATH):
+                legacy = _read_subscribers_json(SUBSCRIBERS_PATH, os.path.getmtime(SUBSCRIBERS_PATH))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO subscriptions (email, ticker) VALUES (?, ?)",
+                    [(email, ticker) for ticker, subs in legacy['emails'].items() for email in subs]
+                )
+    return conn
 
-def save_subscribers(data):
-    """Save subscriber list"""
+def _subscribers_changed():
+    """Drop cached subscriber reads (and the listing holding the old mtime) after a write"""
+    _dir_listing.clear()
+    _read_subscribers.clear()
+
+def update_subscription(email, tickers):
+    """Subscribe an email to exactly the given tickers, touching only that email's rows"""
     try:
-        os.makedirs('data', exist_ok=True)
-        with open('data/subscribers.json', 'w') as f:
-            json.dump(data, f, indent=4)
+        with closing(_connect_subscribers()) as conn:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO subscriptions (email, ticker) VALUES (?, ?) "
+                    "ON CONFLICT (email, ticker) DO UPDATE SET active = 1",
+                    [(email, ticker) for ticker in tickers]
+                )
+                conn.execute(
+                    "UPDATE subscriptions SET active = 0 WHERE email = ? AND active = 1 "
+                    f"AND ticker NOT IN ({', '.join('?' * len(tickers))})",
+                    [email, *tickers]
+                )
+        _subscribers_changed()
         return True
     except:
         return False
 
+def unsubscribe_all(email):
+    """Deactivate every subscription of an email; returns how many were active, or None on error"""
+    try:
+        with closing(_connect_subscribers()) as conn:
+            with conn:
+                removed = conn.execute(
+                    "UPDATE subscriptions SET active = 0 WHERE email = ? AND active = 1", (email,)
+                ).rowcount
+        _subscribers_changed()
+        return removed
+    except:
+        return None
+
+SIGNAL_LABELS = np.array(["🟢 STRONG BUY", "🟢 BUY", "🔴 STRONG SELL", "🔴 SELL", "🟡 HOLD"])
+SIGNAL_CLASSES = np.array(["signal-buy", "signal-buy", "signal-sell", "signal-sell", "signal-hold"])
+
+def get_signals(price_change_pct, rsi):
+    """Generate trading signals for arrays of predictions (RSI of 0 means unavailable)"""
+    pct = np.asarray(price_change_pct, dtype=float)
+    rsi = np.asarray(rsi, dtype=float)
+    no_rsi = rsi == 0
+    
+    choice = np.select(
+        [
+            (pct > 2) & (no_rsi | (rsi < 70)),
+            (pct > 0.5) & (no_rsi | (rsi < 65)),
+            (pct < -2) & (no_rsi | (rsi > 30)),
+            (pct < -0.5) & (no_rsi | (rsi > 35)),
+        ],
+        [0, 1, 2, 3],
+        default=4
+    )
+    return SIGNAL_LABELS[choice], SIGNAL_CLASSES[choice]
+
 def get_signal(price_change_pct, rsi=None):
     """Generate trading signal based on prediction and indicators"""
-    if rsi:
-        if price_change_pct > 2 and rsi < 70:
-            return "🟢 STRONG BUY", "signal-buy"
-        elif price_change_pct > 0.5 and rsi < 65:
-            return "🟢 BUY", "signal-buy"
-        elif price_change_pct < -2 and rsi > 30:
-            return "🔴 STRONG SELL", "signal-sell"
-        elif price_change_pct < -0.5 and rsi > 35:
-            return "🔴 SELL", "signal-sell"
-    else:
-        if price_change_pct > 2:
-            return "🟢 STRONG BUY", "signal-buy"
-        elif price_change_pct > 0.5:
-            return "🟢 BUY", "signal-buy"
-        elif price_change_pct < -2:
-            return "🔴 STRONG SELL", "signal-sell"
-        elif price_change_pct < -0.5:
-            return "🔴 SELL", "signal-sell"
+    signals, classes = get_signals([price_change_pct], [rsi or 0])
+    return str(signals[0]), str(classes[0])
+
+RSI_MSGS = {
+    'overbought': "⚠️ **Overbought** (RSI > 70) - Price may correct downward",
+    'oversold': "✅ **Oversold** (RSI < 30) - Potential buying opportunity",
+    'neutral': "✅ **Neutral** (RSI in healthy range)",
+    None: "RSI data not available",
+}
+
+MACD_MSGS = {
+    'bullish': "📈 **Bullish** momentum (MACD > 0)",
+    'bearish': "📉 **Bearish** momentum (MACD < 0)",
+    None: "MACD data not available",
+}
+
+VOL_MSGS = {
+    'high': "⚡ **High volatility** - Higher risk and opportunity",
+    'moderate': "⚖️ **Moderate volatility** - Normal market conditions",
+    'low': "😌 **Low volatility** - Stable market conditions",
+    None: "Volatility data not available",
+}
+
+OUTLOOK_TAILS = {
+    'positive': """
+    The model indicates potential **upward price movement**. Combined with technical indicators,
+    this suggests a potentially favorable trading opportunity. However, always:
+    - Consider your risk tolerance
+    - Diversify your portfolio
+    - Never invest more than you can afford to lose
+        """,
+    'negative': """
+    The model indicates potential **downward price movement**. This could be a signal to:
+    - Take profits if you're currently holding
+    - Wait for better entry points
+    - Review your position and risk exposure
+        """,
+}
+
+INTERPRETATION_TEMPLATE = """
+    ### 📊 Market Outlook
+    
+    Our AI model predicts a {direction} for tomorrow's closing price.
+    
+    **Trading Signal:** {signal}
+    
+    ### 📉 Technical Analysis
+    - **RSI (Relative Strength Index):** {rsi_msg}
+    - **MACD (Momentum):** {macd_msg}
+    - **Volatility:** {vol_msg}
     
-    return "🟡 HOLD", "signal-hold"
+    ### 💡 What This Means
+    {outlook_tail}"""
 
 def interpret_prediction(current_price, predicted_price, rsi, macd, volatility):
     """Generate user-friendly interpretation"""
@@ -270,69 +659,241 @@ def interpret_prediction(current_price, predicted_price, rsi, macd, volatility):
     # Signal
     signal, _ = get_signal(price_change_pct, rsi)
     
-    # RSI interpretation
+    # Indicator readings select pre-built messages
     if rsi:
-        if rsi > 70:
-            rsi_msg = "⚠️ **Overbought** (RSI > 70) - Price may correct downward"
-        elif rsi < 30:
-            rsi_msg = "✅ **Oversold** (RSI < 30) - Potential buying opportunity"
-        else:
-            rsi_msg = "✅ **Neutral** (RSI in healthy range)"
+        rsi_key = 'overbought' if rsi > 70 else 'oversold' if rsi < 30 else 'neutral'
     else:
-        rsi_msg = "RSI data not available"
+        rsi_key = None
     
-    # MACD interpretation
     if macd:
-        if macd > 0:
-            macd_msg = "📈 **Bullish** momentum (MACD > 0)"
-        else:
-            macd_msg = "📉 **Bearish** momentum (MACD < 0)"
+        macd_key = 'bullish' if macd > 0 else 'bearish'
     else:
-        macd_msg = "MACD data not available"
+        macd_key = None
     
-    # Volatility
     if volatility:
-        if volatility > 0.03:
-            vol_msg = "⚡ **High volatility** - Higher risk and opportunity"
-        elif volatility > 0.015:
-            vol_msg = "⚖️ **Moderate volatility** - Normal market conditions"
-        else:
-            vol_msg = "😌 **Low volatility** - Stable market conditions"
+        vol_key = 'high' if volatility > 0.03 else 'moderate' if volatility > 0.015 else 'low'
     else:
-        vol_msg = "Volatility data not available"
+        vol_key = None
+    
+    return INTERPRETATION_TEMPLATE.format(
+        direction=direction,
+        signal=signal,
+        rsi_msg=RSI_MSGS[rsi_key],
+        macd_msg=MACD_MSGS[macd_key],
+        vol_msg=VOL_MSGS[vol_key],
+        outlook_tail=OUTLOOK_TAILS[outlook]
+    )
+
+def _lttb_indices(x, y, n_out):
+    """Pick n_out indices with Largest-Triangle-Three-Buckets, keeping the visual shape of y"""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    sampled = np.empty(n_out, dtype=np.int64)
+    sampled[0], sampled[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            avg_x = x[hi:edges[i + 2]].mean()
+            avg_y = y[hi:edges[i + 2]].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        sampled[i + 1] = a
     
-    interpretation = f"""
-    ### 📊 Market Outlook
+    return sampled
+
+def _downsampled(logs, column, n_out=MAX_PLOT_POINTS):
+    """x/y trace arguments for a log column, reduced to at most n_out points"""
+    x = logs['timestamp'].to_numpy()
+    y = logs[column].to_numpy(dtype=float)
+    idx = _lttb_indices(x.astype('datetime64[ns]').astype(np.int64).astype(float), y, n_out)
+    return {'x': x[idx], 'y': y[idx]}
+
+def _gradient_styles(values, vmin=-5, vmax=5, cmap='RdYlGn'):
+    """Background/text CSS for a column on a colormap, computed in one vectorized pass"""
+    # matplotlib is only needed by the tables that use it, so it is imported on first use
+    import matplotlib
+    
+    values = np.asarray(values, dtype=float)
+    norm = (np.clip(values, vmin, vmax) - vmin) / (vmax - vmin)
+    rgb = matplotlib.colormaps[cmap](norm)[:, :3]
+    # Light text on dark cells, as Styler.background_gradient does
+    dark = rgb @ np.array([0.2126, 0.7152, 0.0722]) < 0.408
+    rgb = (rgb * 255).astype(int)
+    return [
+        f"background-color: #{r:02x}{g:02x}{b:02x}; color: {'#f1f1f1' if d else '#000000'}" if ok else ''
+        for (r, g, b), d, ok in zip(rgb.tolist(), dark.tolist(), np.isfinite(values).tolist())
+    ]
+
+# Figures are cached on their input data, so reruns that don't change the
+# logs (e.g. a sidebar click) reuse the built figure
+
+@st.cache_data(show_spinner=False)
+def _build_price_fig(ticker, logs):
+    """Actual vs predicted price trend figure"""
+    fig = go.Figure()
     
-    Our AI model predicts a {direction} for tomorrow's closing price.
+    fig.add_trace(go.Scattergl(
+        **_downsampled(logs, 'current_price'),
+        name='Actual',
+        line=dict(color='#2196f3', width=2)
+    ))
     
-    **Trading Signal:** {signal}
+    fig.add_trace(go.Scattergl(
+        **_downsampled(logs, 'predicted_price'),
+        name='Predicted',
+        line=dict(color='#f44336', width=2, dash='dash')
+    ))
     
-    ### 📉 Technical Analysis
-    - **RSI (Relative Strength Index):** {rsi_msg}
-    - **MACD (Momentum):** {macd_msg}
-    - **Volatility:** {vol_msg}
+    fig.update_layout(
+        title=f"{ticker} Price Trend (Last 30 Days)",
+        xaxis_title="Date",
+        yaxis_title="Price ($)",
+        height=300,
+        hovermode='x unified',
+        # Keep zoom/pan when the figure is rebuilt with new predictions
+        uirevision=ticker
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_rsi_fig(logs):
+    """RSI figure with overbought/oversold guides"""
+    fig = go.Figure()
     
-    ### 💡 What This Means
-    """
+    fig.add_trace(go.Scattergl(
+        **_downsampled(logs, 'rsi'),
+        name='RSI',
+        line=dict(color='purple', width=2)
+    ))
     
-    if outlook == "positive":
-        interpretation += """
-    The model indicates potential **upward price movement**. Combined with technical indicators,
-    this suggests a potentially favorable trading opportunity. However, always:
-    - Consider your risk tolerance
-    - Diversify your portfolio
-    - Never invest more than you can afford to lose
-        """
+    # Add overbought/oversold lines
+    fig.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought")
+    fig.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold")
+    
+    fig.update_layout(
+        title="RSI (Relative Strength Index)",
+        xaxis_title="Date",
+        yaxis_title="RSI",
+        height=400
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_macd_fig(logs):
+    """MACD figure with a zero line"""
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scattergl(
+        **_downsampled(logs, 'macd'),
+        name='MACD',
+        line=dict(color='blue', width=2)
+    ))
+    
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    
+    fig.update_layout(
+        title="MACD (Moving Average Convergence Divergence)",
+        xaxis_title="Date",
+        yaxis_title="MACD",
+        height=400
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_error_fig(error_pct, bins=30):
+    """Error histogram binned server-side, so only the bar heights reach the browser"""
+    error_pct = error_pct[np.isfinite(error_pct)]
+    counts, edges = np.histogram(error_pct, bins=bins) if len(error_pct) else ([], np.array([]))
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        name='Error Distribution',
+        marker_color='rgba(100, 100, 200, 0.7)'
+    ))
+    
+    fig.update_layout(
+        title="Prediction Error Distribution (%)",
+        xaxis_title="Error (%)",
+        yaxis_title="Frequency",
+        height=400,
+        bargap=0
+    )
+    return fig
+
+@st.cache_data(show_spinner=False)
+def _build_analytics_fig(ticker, logs, n_out=MAX_PLOT_POINTS):
+    """Actual vs predicted price figure, with a volume row when volume was logged"""
+    from plotly.subplots import make_subplots
+    
+    has_volume = 'volume' in logs.columns
+    
+    if has_volume:
+        fig = make_subplots(
+            rows=2, cols=1,
+            shared_xaxes=True,
+            vertical_spacing=0.05,
+            subplot_titles=(f'{ticker} Price Predictions', 'Trading Volume'),
+            row_heights=[0.7, 0.3]
+        )
     else:
-        interpretation += """
-    The model indicates potential **downward price movement**. This could be a signal to:
-    - Take profits if you're currently holding
-    - Wait for better entry points
-    - Review your position and risk exposure
-        """
+        fig = make_subplots(rows=1, cols=1, subplot_titles=(f'{ticker} Price Predictions',))
     
-    return interpretation
+    # Price traces
+    fig.add_trace(
+        go.Scattergl(
+            **_downsampled(logs, 'current_price', n_out),
+            name='Actual Price',
+            line=dict(color='#2196f3', width=2),
+            fill='tonexty',
+            fillcolor='rgba(33, 150, 243, 0.1)'
+        ),
+        row=1, col=1
+    )
+    
+    fig.add_trace(
+        go.Scattergl(
+            **_downsampled(logs, 'predicted_price', n_out),
+            name='Predicted Price',
+            line=dict(color='#f44336', width=2, dash='dash')
+        ),
+        row=1, col=1
+    )
+    
+    if has_volume:
+        fig.add_trace(
+            go.Bar(
+                x=logs['timestamp'].to_numpy(),
+                y=logs['volume'].to_numpy(),
+                name='Volume',
+                marker_color='rgba(100, 100, 100, 0.5)'
+            ),
+            row=2, col=1
+        )
+        fig.update_yaxes(title_text="Volume", row=2, col=1)
+    
+    fig.update_layout(
+        height=700 if has_volume else 500,
+        hovermode='x unified',
+        showlegend=True,
+        uirevision=ticker
+    )
+    
+    fig.update_xaxes(title_text="Date", row=2 if has_volume else 1, col=1)
+    fig.update_yaxes(title_text="Price ($)", row=1, col=1)
+    
+    return fig
 
 # ══════════════════════════════════════════════════════════════════════════
 # SIDEBAR
@@ -351,14 +912,20 @@ def render_sidebar():
         st.session_state.selected_tickers = ['AAPL']
     
     # Ticker selection with visual display
-    selected = []
-    for ticker, info in TICKERS.items():
-        meta = load_metadata(ticker)
-        status = "✅" if meta else "⏳"
-        label = f"{status} {info['emoji']} {ticker} - {info['name']}"
-        
-        if st.sidebar.checkbox(label, value=ticker in st.session_state.selected_tickers, key=f"cb_{ticker}"):
-            selected.append(ticker)
+    meta_map = load_metadata_bulk(TICKER_KEYS)
+    labels = {
+        ticker: f"{'✅' if meta_map[ticker] else '⏳'} {info['emoji']} {ticker} - {info['name']}"
+        for ticker, info in TICKER_ITEMS
+    }
+    
+    selected = st.sidebar.multiselect(
+        "Tickers",
+        options=TICKER_KEYS,
+        default=st.session_state.selected_tickers,
+        format_func=labels.get,
+        key="ticker_select",
+        label_visibility="collapsed"
+    )
     
     st.session_state.selected_tickers = selected if selected else ['AAPL']
     
@@ -376,7 +943,7 @@ def render_sidebar():
     # Quick stats
     st.sidebar.markdown("### 📌 Quick Stats")
     total_tickers = len(TICKERS)
-    trained_models = sum(1 for t in TICKERS if load_metadata(t))
+    trained_models = sum(1 for m in meta_map.values() if m)
     monitored = len(st.session_state.selected_tickers)
     
     st.sidebar.metric("Available Tickers", total_tickers)
@@ -400,6 +967,9 @@ def render_dashboard():
         st.warning("Please select at least one ticker from the sidebar")
         return
     
+    # Read every selected ticker's recent history once for the whole page
+    logs_by_ticker = load_logs_bulk(tickers, n=30)
+    
     # Overview metrics
     st.markdown("### 📈 Portfolio Overview")
     cols = st.columns(min(len(tickers), 4))
@@ -407,10 +977,10 @@ def render_dashboard():
     for i, ticker in enumerate(tickers[:4]):
         with cols[i]:
             info = TICKERS[ticker]
-            logs = load_logs(ticker)
+            logs = logs_by_ticker[ticker]
             
             if not logs.empty:
-                latest = logs.iloc[-1]
+                latest = logs.iloc[-1].to_dict()
                 change_pct = latest['price_change_pct']
                 
                 delta_color = "normal" if change_pct >= 0 else "inverse"
@@ -435,25 +1005,24 @@ def render_dashboard():
     
     for ticker in tickers:
         with st.expander(f"{TICKERS[ticker]['emoji']} {ticker} - {TICKERS[ticker]['name']}", expanded=True):
-            render_ticker_prediction(ticker)
+            render_ticker_prediction(ticker, logs_by_ticker[ticker])
     
     st.markdown("---")
     
     # Comparative analysis
     if len(tickers) > 1:
         st.markdown("### 📊 Comparative Analysis")
-        render_comparative_analysis(tickers)
+        render_comparative_analysis(tickers, logs_by_ticker)
 
-def render_ticker_prediction(ticker):
-    """Render detailed prediction for a single ticker"""
-    logs = load_logs(ticker)
+def render_ticker_prediction(ticker, logs):
+    """Render detailed prediction for a single ticker from its pre-loaded logs"""
     meta = load_metadata(ticker)
     
     if logs.empty:
         st.warning(f"No predictions yet for {ticker}. Run the model first!")
         return
     
-    latest = logs.iloc[-1]
+    latest = logs.iloc[-1].to_dict()
     
     # Create columns for metrics
     col1, col2, col3, col4 = st.columns(4)
@@ -495,47 +1064,24 @@ def render_ticker_prediction(ticker):
     
     # Mini chart
     if len(logs) > 1:
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=logs['timestamp'],
-            y=logs['current_price'],
-            name='Actual',
-            line=dict(color='#2196f3', width=2)
-        ))
-        
-        fig.add_trace(go.Scatter(
-            x=logs['timestamp'],
-            y=logs['predicted_price'],
-            name='Predicted',
-            line=dict(color='#f44336', width=2, dash='dash')
-        ))
-        
-        fig.update_layout(
-            title=f"{ticker} Price Trend (Last 30 Days)",
-            xaxis_title="Date",
-            yaxis_title="Price ($)",
-            height=300,
-            hovermode='x unified'
-        )
-        
+        fig = _build_price_fig(ticker, logs[['timestamp', 'current_price', 'predicted_price']])
         st.plotly_chart(fig, use_container_width=True)
 
-def render_comparative_analysis(tickers):
+def render_comparative_analysis(tickers, logs_by_ticker):
     """Render comparative analysis across multiple tickers"""
     # Collect latest predictions
     data = []
     for ticker in tickers:
-        logs = load_logs(ticker)
+        logs = logs_by_ticker[ticker]
         if not logs.empty:
-            latest = logs.iloc[-1]
+            latest = logs.iloc[-1].to_dict()
             data.append({
                 'Ticker': ticker,
                 'Name': TICKERS[ticker]['name'],
                 'Current': latest['current_price'],
                 'Predicted': latest['predicted_price'],
                 'Change %': latest['price_change_pct'],
-                'RSI': latest.get('rsi', 0)
+                'RSI': latest.get('rsi') or 0
             })
     
     if not data:
@@ -543,16 +1089,18 @@ def render_comparative_analysis(tickers):
         return
     
     df = pd.DataFrame(data)
+    df['Signal'], _ = get_signals(df['Change %'].to_numpy(), df['RSI'].to_numpy())
     
     # Performance comparison chart
+    changes = df['Change %'].to_numpy()
     fig = go.Figure()
     
     fig.add_trace(go.Bar(
         x=df['Ticker'],
-        y=df['Change %'],
-        text=df['Change %'].apply(lambda x: f"{x:+.2f}%"),
+        y=changes,
+        text=[f"{x:+.2f}%" for x in changes],
         textposition='outside',
-        marker_color=df['Change %'].apply(lambda x: '#4caf50' if x > 0 else '#f44336')
+        marker_color=np.where(changes > 0, '#4caf50', '#f44336')
     ))
     
     fig.update_layout(
@@ -571,7 +1119,7 @@ def render_comparative_analysis(tickers):
             'Predicted': '${:.2f}',
             'Change %': '{:+.2f}%',
             'RSI': '{:.1f}'
-        }).background_gradient(subset=['Change %'], cmap='RdYlGn', vmin=-5, vmax=5),
+        }).apply(_gradient_styles, subset=['Change %']),
         use_container_width=True
     )
 
@@ -579,6 +1127,8 @@ def render_comparative_analysis(tickers):
 # PAGE: SUBSCRIPTIONS
 # ══════════════════════════════════════════════════════════════════════════
 
+# Typing an email or ticking tickers reruns only this page, not the sidebar loaders
+@st.fragment
 def render_subscriptions():
     """Render subscription management page"""
     st.markdown("## 📧 Email Subscription Management")
@@ -600,12 +1150,14 @@ def render_subscriptions():
     
     sub_data = load_subscribers()
     selected_for_sub = []
+    email_lower = email.lower()
     
     cols = st.columns(3)
-    for i, (ticker, info) in enumerate(TICKERS.items()):
+    for i, (ticker, info) in enumerate(TICKER_ITEMS):
         with cols[i % 3]:
-            current_subs = sub_data.get('emails', {}).get(ticker, [])
-            is_subscribed = email.lower() in current_subs if email else False
+            # Emails are held as sets, so each check is a hash lookup
+            current_subs = sub_data.get('emails', {}).get(ticker, ())
+            is_subscribed = email_lower in current_subs if email else False
             
             if st.checkbox(
                 f"{info['emoji']} {ticker} - {info['name']}", 
@@ -618,26 +1170,8 @@ def render_subscriptions():
     
     with col1:
         if st.button("✅ Subscribe / Update", use_container_width=True):
-            if email and '@' in email:
-                sub_data = load_subscribers()
-                
-                # Update subscriptions
-                for ticker in TICKERS.keys():
-                    if 'emails' not in sub_data:
-                        sub_data['emails'] = {}
-                    if ticker not in sub_data['emails']:
-                        sub_data['emails'][ticker] = []
-                    
-                    email_lower = email.lower()
-                    
-                    if ticker in selected_for_sub:
-                        if email_lower not in sub_data['emails'][ticker]:
-                            sub_data['emails'][ticker].append(email_lower)
-                    else:
-                        if email_lower in sub_data['emails'][ticker]:
-                            sub_data['emails'][ticker].remove(email_lower)
-                
-                if save_subscribers(sub_data):
+            if email and _EMAIL_RE.match(email):
+                if update_subscription(email_lower, selected_for_sub):
                     st.success(f"✅ Subscription updated! You'll receive predictions for {len(selected_for_sub)} stock(s)")
                     st.balloons()
                 else:
@@ -648,17 +1182,9 @@ def render_subscriptions():
     with col2:
         if st.button("❌ Unsubscribe from All", use_container_width=True):
             if email:
-                sub_data = load_subscribers()
-                email_lower = email.lower()
-                
-                removed = 0
-                for ticker in TICKERS.keys():
-                    if ticker in sub_data.get('emails', {}):
-                        if email_lower in sub_data['emails'][ticker]:
-                            sub_data['emails'][ticker].remove(email_lower)
-                            removed += 1
+                removed = unsubscribe_all(email_lower)
                 
-                if save_subscribers(sub_data):
+                if removed is not None:
                     st.success(f"Unsubscribed from {removed} stock(s)")
                 else:
                     st.error("Error processing unsubscription")
@@ -684,7 +1210,7 @@ def render_subscriptions():
     # Per-ticker breakdown
     with st.expander("📋 Per-Ticker Breakdown"):
         ticker_stats = []
-        for ticker, info in TICKERS.items():
+        for ticker, info in TICKER_ITEMS:
             count = len(sub_data.get('emails', {}).get(ticker, []))
             ticker_stats.append({
                 'Ticker': f"{info['emoji']} {ticker}",
@@ -736,59 +1262,18 @@ def render_analytics():
     # Time series with volume
     st.markdown("### 📈 Price & Volume Analysis")
     
-    # Create subplot with secondary y-axis
-    fig = make_subplots(
-        rows=2, cols=1,
-        shared_xaxes=True,
-        vertical_spacing=0.05,
-        subplot_titles=(f'{ticker} Price Predictions', 'Trading Volume'),
-        row_heights=[0.7, 0.3]
-    )
+    # Volume row only when the monitor has logged volume
+    has_volume = 'volume' in logs.columns and logs['volume'].notna().any()
+    columns = ['timestamp', 'current_price', 'predicted_price'] + (['volume'] if has_volume else [])
     
-    # Price traces
-    fig.add_trace(
-        go.Scatter(
-            x=logs['timestamp'],
-            y=logs['current_price'],
-            name='Actual Price',
-            line=dict(color='#2196f3', width=2),
-            fill='tonexty',
-            fillcolor='rgba(33, 150, 243, 0.1)'
-        ),
-        row=1, col=1
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=logs['timestamp'],
-            y=logs['predicted_price'],
-            name='Predicted Price',
-            line=dict(color='#f44336', width=2, dash='dash')
-        ),
-        row=1, col=1
-    )
-    
-    # Volume (if available in logs)
-    # Note: Volume would need to be added to logs in monitor.py
-    fig.add_trace(
-        go.Bar(
-            x=logs['timestamp'],
-            y=[1000000] * len(logs),  # Placeholder - replace with actual volume
-            name='Volume',
-            marker_color='rgba(100, 100, 100, 0.5)'
-        ),
-        row=2, col=1
-    )
-    
-    fig.update_layout(
-        height=700,
-        hovermode='x unified',
-        showlegend=True
-    )
-    
-    fig.update_xaxes(title_text="Date", row=2, col=1)
-    fig.update_yaxes(title_text="Price ($)", row=1, col=1)
-    fig.update_yaxes(title_text="Volume", row=2, col=1)
+    # Long histories are downsampled for the browser unless every point is asked for
+    n_out = MAX_PLOT_POINTS
+    if len(logs) > MAX_PLOT_POINTS and st.checkbox(
+        f"Show all {len(logs):,} points",
+        help=f"By default the price chart keeps {MAX_PLOT_POINTS:,} points that preserve its shape"
+    ):
+        n_out = len(logs)
+    fig = _build_analytics_fig(ticker, logs[columns], n_out)
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -802,48 +1287,14 @@ def render_analytics():
     with col1:
         # RSI chart
         if 'rsi' in logs.columns and logs['rsi'].notna().any():
-            fig_rsi = go.Figure()
-            
-            fig_rsi.add_trace(go.Scatter(
-                x=logs['timestamp'],
-                y=logs['rsi'],
-                name='RSI',
-                line=dict(color='purple', width=2)
-            ))
-            
-            # Add overbought/oversold lines
-            fig_rsi.add_hline(y=70, line_dash="dash", line_color="red", annotation_text="Overbought")
-            fig_rsi.add_hline(y=30, line_dash="dash", line_color="green", annotation_text="Oversold")
-            
-            fig_rsi.update_layout(
-                title="RSI (Relative Strength Index)",
-                xaxis_title="Date",
-                yaxis_title="RSI",
-                height=400
-            )
+            fig_rsi = _build_rsi_fig(logs[['timestamp', 'rsi']])
             
             st.plotly_chart(fig_rsi, use_container_width=True)
     
     with col2:
         # MACD chart
         if 'macd' in logs.columns and logs['macd'].notna().any():
-            fig_macd = go.Figure()
-            
-            fig_macd.add_trace(go.Scatter(
-                x=logs['timestamp'],
-                y=logs['macd'],
-                name='MACD',
-                line=dict(color='blue', width=2)
-            ))
-            
-            fig_macd.add_hline(y=0, line_dash="dash", line_color="gray")
-            
-            fig_macd.update_layout(
-                title="MACD (Moving Average Convergence Divergence)",
-                xaxis_title="Date",
-                yaxis_title="MACD",
-                height=400
-            )
+            fig_macd = _build_macd_fig(logs[['timestamp', 'macd']])
             
             st.plotly_chart(fig_macd, use_container_width=True)
     
@@ -855,32 +1306,20 @@ def render_analytics():
     col1, col2 = st.columns(2)
     
     with col1:
-        # Error distribution
-        errors = logs['predicted_price'] - logs['current_price']
-        error_pct = (errors / logs['current_price']) * 100
-        
-        fig_err = go.Figure()
-        fig_err.add_trace(go.Histogram(
-            x=error_pct,
-            nbinsx=30,
-            name='Error Distribution',
-            marker_color='rgba(100, 100, 200, 0.7)'
-        ))
+        # Error distribution (plain arrays: no index alignment or temporary Series)
+        current = logs['current_price'].to_numpy(dtype=float)
+        errors = logs['predicted_price'].to_numpy(dtype=float) - current
+        error_pct = errors / current * 100
         
-        fig_err.update_layout(
-            title="Prediction Error Distribution (%)",
-            xaxis_title="Error (%)",
-            yaxis_title="Frequency",
-            height=400
-        )
+        fig_err = _build_error_fig(error_pct)
         
         st.plotly_chart(fig_err, use_container_width=True)
     
     with col2:
-        # Accuracy metrics
-        mae = abs(errors).mean()
-        rmse = np.sqrt((errors ** 2).mean())
-        mape = abs(error_pct).mean()
+        # Accuracy metrics (nan-aware, matching pandas' mean)
+        mae = np.nanmean(np.abs(errors))
+        rmse = np.sqrt(np.nanmean(errors * errors))
+        mape = np.nanmean(np.abs(error_pct))
         
         st.markdown("**Accuracy Metrics:**")
         st.metric("Mean Absolute Error", f"${mae:.2f}")
@@ -898,10 +1337,15 @@ def render_analytics():
     # Recent predictions table
     st.markdown("### 📋 Recent Predictions")
     
-    recent = logs.tail(20).copy()
-    recent = recent[['timestamp', 'current_price', 'predicted_price', 'price_change', 'price_change_pct']]
-    recent['timestamp'] = recent['timestamp'].dt.strftime('%Y-%m-%d %H:%M')
-    recent.columns = ['Date', 'Actual Price', 'Predicted Price', 'Change ($)', 'Change (%)']
+    # Build the display frame in one go from the last rows; Styler formats the numbers
+    tail = logs.tail(20)
+    recent = pd.DataFrame({
+        'Date': tail['timestamp'].dt.strftime('%Y-%m-%d %H:%M'),
+        'Actual Price': tail['current_price'],
+        'Predicted Price': tail['predicted_price'],
+        'Change ($)': tail['price_change'],
+        'Change (%)': tail['price_change_pct'],
+    })
     
     st.dataframe(
         recent.style.format({
@@ -909,15 +1353,15 @@ def render_analytics():
             'Predicted Price': '${:.2f}',
             'Change ($)': '${:+.2f}',
             'Change (%)': '{:+.2f}%'
-        }).background_gradient(subset=['Change (%)'], cmap='RdYlGn', vmin=-5, vmax=5),
-        use_container_width=True
+        }).apply(_gradient_styles, subset=['Change (%)']),
+        use_container_width=True,
+        hide_index=True
     )
     
-    # Download data
-    csv = logs.to_csv(index=False)
+    # Download data (serialized only when the button is clicked)
     st.download_button(
         label=f"⬇️ Download {ticker} Full Data (CSV)",
-        data=csv,
+        data=lambda: load_logs(ticker, tail_bytes=None).to_csv(index=False),
         file_name=f"{ticker}_predictions_{datetime.now().strftime('%Y%m%d')}.csv",
         mime="text/csv"
     )
@@ -926,6 +1370,69 @@ def render_analytics():
 # PAGE: INSIGHTS
 # ══════════════════════════════════════════════════════════════════════════
 
+def _render_ticker_insight(logs):
+    """Insight panel for one ticker from its pre-loaded logs"""
+    latest = logs.iloc[-1].to_dict()
+    
+    # Key metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Current", f"${latest['current_price']:.2f}")
+    with col2:
+        st.metric("Predicted", f"${latest['predicted_price']:.2f}")
+    with col3:
+        signal, _ = get_signal(latest['price_change_pct'], latest.get('rsi'))
+        st.markdown(f"**Signal:** {signal}")
+    with col4:
+        trend = "📈 Bullish" if latest['price_change_pct'] > 0 else "📉 Bearish"
+        st.markdown(f"**Trend:** {trend}")
+    
+    # Detailed interpretation
+    st.markdown("---")
+    interpretation = interpret_prediction(
+        latest['current_price'],
+        latest['predicted_price'],
+        latest.get('rsi'),
+        latest.get('macd'),
+        latest.get('volatility')
+    )
+    st.markdown(interpretation)
+    
+    # Risk assessment
+    st.markdown("---")
+    st.markdown("### ⚖️ Risk Assessment")
+    
+    volatility = latest.get('volatility', 0.02)
+    
+    if volatility > 0.03:
+        risk_level = "🔴 HIGH"
+        risk_color = "warning-box"
+        risk_msg = """
+        This stock is experiencing **high volatility**, indicating larger price swings.
+        This presents both higher risk and potential opportunity. Consider:
+        - Using stop-loss orders
+        - Smaller position sizes
+        - Higher risk tolerance required
+        """
+    elif volatility > 0.015:
+        risk_level = "🟡 MODERATE"
+        risk_color = "info-box"
+        risk_msg = """
+        This stock has **moderate volatility**, typical of normal market conditions.
+        This is suitable for most investors with moderate risk tolerance.
+        """
+    else:
+        risk_level = "🟢 LOW"
+        risk_color = "success-box"
+        risk_msg = """
+        This stock shows **low volatility**, indicating more stable price movement.
+        This is suitable for conservative investors seeking stability.
+        """
+    
+    st.markdown(f"**Risk Level:** {risk_level}")
+    st.markdown(f'<div class="{risk_color}">{risk_msg}</div>', unsafe_allow_html=True)
+
 def render_insights():
     """Render AI-generated insights and recommendations"""
     st.markdown("## 💡 AI-Powered Market Insights")
@@ -943,84 +1450,29 @@ def render_insights():
     
     st.markdown("---")
     
+    logs_by_ticker = load_logs_bulk(tickers)
+    
     for ticker in tickers:
-        logs = load_logs(ticker)
+        logs = logs_by_ticker[ticker]
         
         if logs.empty:
             continue
         
-        latest = logs.iloc[-1]
         info = TICKERS[ticker]
         
         with st.expander(f"{info['emoji']} {ticker} - {info['name']}", expanded=len(tickers)==1):
-            # Key metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Current", f"${latest['current_price']:.2f}")
-            with col2:
-                st.metric("Predicted", f"${latest['predicted_price']:.2f}")
-            with col3:
-                signal, _ = get_signal(latest['price_change_pct'], latest.get('rsi'))
-                st.markdown(f"**Signal:** {signal}")
-            with col4:
-                trend = "📈 Bullish" if latest['price_change_pct'] > 0 else "📉 Bearish"
-                st.markdown(f"**Trend:** {trend}")
-            
-            # Detailed interpretation
-            st.markdown("---")
-            interpretation = interpret_prediction(
-                latest['current_price'],
-                latest['predicted_price'],
-                latest.get('rsi'),
-                latest.get('macd'),
-                latest.get('volatility')
-            )
-            st.markdown(interpretation)
-            
-            # Risk assessment
-            st.markdown("---")
-            st.markdown("### ⚖️ Risk Assessment")
-            
-            volatility = latest.get('volatility', 0.02)
-            
-            if volatility > 0.03:
-                risk_level = "🔴 HIGH"
-                risk_color = "warning-box"
-                risk_msg = """
-                This stock is experiencing **high volatility**, indicating larger price swings.
-                This presents both higher risk and potential opportunity. Consider:
-                - Using stop-loss orders
-                - Smaller position sizes
-                - Higher risk tolerance required
-                """
-            elif volatility > 0.015:
-                risk_level = "🟡 MODERATE"
-                risk_color = "info-box"
-                risk_msg = """
-                This stock has **moderate volatility**, typical of normal market conditions.
-                This is suitable for most investors with moderate risk tolerance.
-                """
-            else:
-                risk_level = "🟢 LOW"
-                risk_color = "success-box"
-                risk_msg = """
-                This stock shows **low volatility**, indicating more stable price movement.
-                This is suitable for conservative investors seeking stability.
-                """
-            
-            st.markdown(f"**Risk Level:** {risk_level}")
-            st.markdown(f'<div class="{risk_color}">{risk_msg}</div>', unsafe_allow_html=True)
+            _render_ticker_insight(logs)
 
 # ══════════════════════════════════════════════════════════════════════════
 # PAGE: ABOUT
 # ══════════════════════════════════════════════════════════════════════════
 
-def render_about():
-    """Render about page with documentation"""
-    st.markdown("## ℹ️ About Market Monitor Pro")
+@st.cache_resource
+def _about_markdown():
+    """Static about-page documentation, built once per server process"""
+    return """
+    ## ℹ️ About Market Monitor Pro
     
-    st.markdown("""
     ### 🎯 What is Market Monitor Pro?
     
     Market Monitor Pro is an advanced AI-powered stock market prediction system that uses
@@ -1114,12 +1566,27 @@ def render_about():
     **Made with ❤️ using Python, Machine Learning, and Coffee ☕**
     
     *Version 2.0 - Enhanced Multi-Ticker Edition*
-    """)
+    """
+
+def render_about():
+    """Render about page with documentation"""
+    st.markdown(_about_markdown())
 
 # ══════════════════════════════════════════════════════════════════════════
 # MAIN APP
 # ══════════════════════════════════════════════════════════════════════════
 
+FOOTER_HTML = """
+---
+<div style='text-align: center; color: gray; padding: 1rem;'>
+    <p><strong>Market Monitor Pro</strong> © 2026 | Powered by AI & Machine Learning</p>
+    <p style='font-size: 0.8rem;'>
+        ⚠️ For educational purposes only. Not financial advice. 
+        Always consult with a qualified financial advisor before making investment decisions.
+    </p>
+</div>
+"""
+
 def main():
     """Main application entry point"""
     
@@ -1139,16 +1606,7 @@ def main():
         render_about()
     
     # Footer
-    st.markdown("---")
-    st.markdown("""
-        <div style='text-align: center; color: gray; padding: 1rem;'>
-            <p><strong>Market Monitor Pro</strong> © 2026 | Powered by AI & Machine Learning</p>
-            <p style='font-size: 0.8rem;'>
-                ⚠️ For educational purposes only. Not financial advice. 
-                Always consult with a qualified financial advisor before making investment decisions.
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
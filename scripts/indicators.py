@@ -0,0 +1,251 @@
+"""
+Technical Indicators - array kernels behind the monitor's feature engineering
+Every function takes float64 NumPy arrays and reproduces the pandas definitions
+used in the training notebook. The EMA, RSI and rolling std kernels are
+JIT-compiled when numba is installed; NumPy (and bottleneck, if present)
+implementations are used otherwise.
+"""
+
+import numpy as np
+from scipy.signal import lfilter
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is optional; rolling windows fall back to NumPy
+    bn = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; kernels fall back to NumPy
+    njit = None
+
+
+def rolling_mean(values, window):
+    """Trailing rolling mean, NaN until the window is full (pandas .rolling().mean())"""
+    if bn is not None and len(values) >= window:
+        return bn.move_mean(values, window, min_count=window)
+    out = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        out[window - 1:] = np.convolve(values, np.ones(window) / window, 'valid')
+    return out
+
+
+def rolling_means(values, windows):
+    """Trailing rolling means for several windows from one shared cumulative sum
+
+    For NaN-free series such as prices; NaN until each window is full.
+    """
+    if bn is not None:
+        return [rolling_mean(values, window) for window in windows]
+    csum = np.concatenate(([0.0], np.cumsum(values)))
+    means = []
+    for window in windows:
+        out = np.full(values.shape, np.nan)
+        if len(values) >= window:
+            out[window - 1:] = (csum[window:] - csum[:-window]) / window
+        means.append(out)
+    return means
+
+
+def shift(values, periods):
+    """Shift an array forward by ``periods`` rows, padding with NaN"""
+    out = np.full(values.shape, np.nan)
+    out[periods:] = values[:-periods]
+    return out
+
+
+if njit is not None:
+    # NaN marks the warm-up rows of the series these kernels read or return,
+    # so fastmath (which assumes there are none) stays off
+    @njit(cache=True)
+    def ema(values, span):
+        """Exponential moving average matching pandas .ewm(span=span, adjust=False).mean()"""
+        out = np.empty(values.shape)
+        if len(values) == 0:
+            return out
+        alpha = 2 / (span + 1)
+        out[0] = values[0]
+        for i in range(1, len(values)):
+            out[i] = alpha * values[i] + (1 - alpha) * out[i - 1]
+        return out
+
+    @njit(cache=True, error_model='numpy')
+    def rsi(close, window=14):
+        """RSI over simple rolling means of gains and losses (the training definition)"""
+        n = len(close)
+        out = np.full(n, np.nan)
+        gains = np.zeros(n)
+        losses = np.zeros(n)
+        gain_sum = 0.0
+        loss_sum = 0.0
+        for i in range(n):
+            # First diff is treated as no move
+            if i > 0:
+                delta = close[i] - close[i - 1]
+                gains[i] = max(delta, 0.0)
+                losses[i] = max(-delta, 0.0)
+            gain_sum += gains[i]
+            loss_sum += losses[i]
+            if i >= window:
+                gain_sum -= gains[i - window]
+                loss_sum -= losses[i - window]
+            if i >= window - 1:
+                out[i] = 100 - 100 / (1 + gain_sum / loss_sum)
+        return out
+
+    @njit(cache=True)
+    def rolling_std(values, window):
+        """Trailing rolling sample standard deviation (pandas .rolling().std())"""
+        n = len(values)
+        out = np.full(n, np.nan)
+        for i in range(window - 1, n):
+            mean = 0.0
+            for j in range(i - window + 1, i + 1):
+                mean += values[j]
+            mean /= window
+            total = 0.0
+            for j in range(i - window + 1, i + 1):
+                total += (values[j] - mean) ** 2
+            out[i] = np.sqrt(total / (window - 1))
+        return out
+else:
+    def ema(values, span):
+        """Exponential moving average matching pandas .ewm(span=span, adjust=False).mean()"""
+        alpha = 2 / (span + 1)
+        if len(values) == 0:
+            return values.copy()
+        out, _ = lfilter([alpha], [1, alpha - 1], values, zi=[(1 - alpha) * values[0]])
+        return out
+
+    def rsi(close, window=14):
+        """RSI over simple rolling means of gains and losses (the training definition)"""
+        # Prepending the first close makes the first diff no move
+        delta = np.diff(close, prepend=close[:1])
+        gain = rolling_mean(np.maximum(delta, 0.0), window)
+        loss = rolling_mean(np.maximum(-delta, 0.0), window)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return 100 - (100 / (1 + gain / loss))
+
+    def rolling_std(values, window):
+        """Trailing rolling sample standard deviation (pandas .rolling().std())"""
+        if bn is not None and len(values) >= window:
+            return bn.move_std(values, window, min_count=window, ddof=1)
+        out = np.full(values.shape, np.nan)
+        if len(values) >= window:
+            windows = np.lib.stride_tricks.sliding_window_view(values, window)
+            out[window - 1:] = windows.std(axis=1, ddof=1)
+        return out
+
+
+def compute_features(open_, high, low, close, volume):
+    """Compute the training features as {column name: array}"""
+    # Exponential Moving Averages / MACD
+    ema_12 = ema(close, 12)
+    ema_26 = ema(close, 26)
+    macd = ema_12 - ema_26
+
+    # Moving Averages (MA_20 doubles as the Bollinger middle band)
+    ma_5, ma_10, bb_middle, ma_50 = rolling_means(close, (5, 10, 20, 50))
+
+    # Bollinger Bands
+    bb_std = rolling_std(close, 20)
+
+    daily_return = np.empty_like(close)
+    daily_return[0] = np.nan
+    np.divide(close[1:], close[:-1], out=daily_return[1:])
+    daily_return[1:] -= 1
+
+    volume_ma_5 = rolling_mean(volume, 5)
+
+    features = {
+        'MA_5': ma_5,
+        'MA_10': ma_10,
+        'MA_20': bb_middle,
+        'MA_50': ma_50,
+        'EMA_12': ema_12,
+        'EMA_26': ema_26,
+        'MACD': macd,
+        'MACD_Signal': ema(macd, 9),
+        'RSI': rsi(close, 14),
+        'BB_Middle': bb_middle,
+        'BB_Upper': bb_middle + bb_std * 2,
+        'BB_Lower': bb_middle - bb_std * 2,
+        'Daily_Return': daily_return,
+        'Price_Range': high - low,
+        'Price_Change': close - open_,
+        'Volume_MA_5': volume_ma_5,
+        'Volume_Ratio': volume / volume_ma_5,
+        'Volatility': rolling_std(daily_return, 20),
+    }
+
+    # Lag features
+    for i in [1, 2, 3, 5, 7]:
+        features[f'Close_Lag_{i}'] = shift(close, i)
+        features[f'Volume_Lag_{i}'] = shift(volume, i)
+
+    return features
+
+
+def _tail_mean(values, window):
+    """Mean of the last ``window`` values, NaN when there are fewer"""
+    return values[-window:].mean() if len(values) >= window else np.nan
+
+
+def _tail_std(values, window):
+    """Sample standard deviation of the last ``window`` values, NaN when there are fewer"""
+    return values[-window:].std(ddof=1) if len(values) >= window else np.nan
+
+
+def compute_latest_features(open_, high, low, close, volume):
+    """Compute only the last row of compute_features, as {column name: float}
+
+    Rolling indicators read just their trailing window; the EMAs still run over
+    the whole history, since adjust=False seeds them from the first close.
+    """
+    n = len(close)
+    ema_12 = ema(close, 12)
+    ema_26 = ema(close, 26)
+    macd = ema_12 - ema_26
+
+    # RSI over the last 14 diffs (the very first diff counts as no move)
+    delta = np.diff(close[-15:], prepend=close[0] if n <= 15 else np.nan)[-14:]
+    gain = np.maximum(delta, 0.0).mean() if n >= 14 else np.nan
+    loss = np.maximum(-delta, 0.0).mean() if n >= 14 else np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi_last = 100 - (100 / (1 + gain / loss))
+
+    ma_20 = _tail_mean(close, 20)
+    bb_std = _tail_std(close, 20)
+    volume_ma_5 = _tail_mean(volume, 5)
+
+    # Returns exist from the second bar on, so Volatility needs 21 closes
+    recent = close[-21:]
+    returns = recent[1:] / recent[:-1] - 1
+
+    features = {
+        'MA_5': _tail_mean(close, 5),
+        'MA_10': _tail_mean(close, 10),
+        'MA_20': ma_20,
+        'MA_50': _tail_mean(close, 50),
+        'EMA_12': ema_12[-1],
+        'EMA_26': ema_26[-1],
+        'MACD': macd[-1],
+        'MACD_Signal': ema(macd, 9)[-1],
+        'RSI': rsi_last,
+        'BB_Middle': ma_20,
+        'BB_Upper': ma_20 + bb_std * 2,
+        'BB_Lower': ma_20 - bb_std * 2,
+        'Daily_Return': returns[-1] if len(returns) else np.nan,
+        'Price_Range': high[-1] - low[-1],
+        'Price_Change': close[-1] - open_[-1],
+        'Volume_MA_5': volume_ma_5,
+        'Volume_Ratio': volume[-1] / volume_ma_5,
+        'Volatility': _tail_std(returns, 20),
+    }
+
+    # Lag features
+    for i in [1, 2, 3, 5, 7]:
+        features[f'Close_Lag_{i}'] = close[-1 - i] if n > i else np.nan
+        features[f'Volume_Lag_{i}'] = volume[-1 - i] if n > i else np.nan
+
+    return {name: float(value) for name, value in features.items()}
@@ -6,37 +6,295 @@ This script runs daily to fetch latest market data, make predictions, and log re
 import pandas as pd
 import numpy as np
 import joblib
-import yfinance as yf
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
 from datetime import datetime, timedelta
 import os
 import json
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import sqlite3
 import sys
+import functools
+import importlib.metadata
+import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from string import Template
+from types import MappingProxyType
+
+from indicators import compute_features, compute_latest_features
+
+try:
+    import orjson
+    json_loads = orjson.loads
+    
+    def _json_line(obj):
+        """Serialize a log entry as one newline-terminated JSON line"""
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    json_loads = json.loads
+    
+    def _json_line(obj):
+        """Serialize a log entry as one newline-terminated JSON line"""
+        return (json.dumps(obj) + '\n').encode()
+
+# Tickers with trained models (same registry as the Streamlit app), read-only
+AVAILABLE_TICKERS = MappingProxyType({
+    'AAPL': 'Apple Inc.',
+    'MSFT': 'Microsoft Corp.',
+    'GOOGL': 'Alphabet Inc.',
+    'AMZN': 'Amazon.com Inc.',
+    'TSLA': 'Tesla Inc.',
+    'META': 'Meta Platforms',
+    'NVDA': 'NVIDIA Corp.',
+    'JPM': 'JPMorgan Chase',
+    'V': 'Visa Inc.',
+    'JNJ': 'Johnson & Johnson',
+})
+_TICKER_KEYS = tuple(AVAILABLE_TICKERS)
+
+# Recipients per SMTP envelope (kept under common per-message recipient limits)
+EMAIL_BATCH_SIZE = 50
+
+# HTML alert body, filled once per run with preformatted values
+EMAIL_TEMPLATE = Template("""
+<html>
+<body style="font-family: Arial, sans-serif;">
+    <h2>Daily Market Monitor Report</h2>
+    <p><strong>Ticker:</strong> $ticker</p>
+    <p><strong>Date:</strong> $timestamp</p>
+    <hr>
+    <h3>Price Analysis</h3>
+    <p><strong>Current Price:</strong> $$$current_price</p>
+    <p><strong>Predicted Price (Next Day):</strong> $$$predicted_price</p>
+    <p><strong>Expected Change:</strong> $$$price_change ($price_change_pct%)</p>
+    <hr>
+    <h3>Technical Indicators</h3>
+    <p><strong>RSI:</strong> $rsi</p>
+    <p><strong>MACD:</strong> $macd</p>
+    <hr>
+    <p style="color: gray; font-size: 12px;">
+        This is an automated report. Past performance does not guarantee future results.
+    </p>
+</body>
+</html>
+""")
+
+# Columnar schema for the per-day Parquet prediction logs
+LOG_SCHEMA = pa.schema([
+    ('timestamp', pa.timestamp('s')),
+    ('ticker', pa.dictionary(pa.int8(), pa.string())),
+    ('current_price', pa.float32()),
+    ('predicted_price', pa.float32()),
+    ('price_change', pa.float32()),
+    ('price_change_pct', pa.float32()),
+    ('rsi', pa.float32()),
+    ('macd', pa.float32()),
+])
+
+
+def _fmt_indicator(value):
+    """Format an optional indicator value for the alert email"""
+    return 'N/A' if value is None else f"{value:.2f}"
+
+
+# First yfinance release whose requests go through curl_cffi; earlier ones
+# expect a requests.Session and fail on a curl_cffi one
+YF_CURL_CFFI_VERSION = (0, 2, 54)
+
+
+def _yfinance_version():
+    """Installed yfinance version as a tuple of ints, or None if it cannot be read"""
+    try:
+        version = importlib.metadata.version('yfinance')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+    return tuple(int(part) for part in re.findall(r'\d+', version)[:3])
+
+
+@functools.lru_cache(maxsize=None)
+def _yf_session():
+    """One keep-alive HTTP session per process for all Yahoo Finance requests, or None"""
+    version = _yfinance_version()
+    if version is None or version < YF_CURL_CFFI_VERSION:
+        # Older yfinance manages its own requests session
+        return None
+    try:
+        from curl_cffi import requests as curl_requests
+    except ImportError:
+        return None
+    return curl_requests.Session(impersonate='chrome')
+
+
+def _column(df, name):
+    """Return a price/volume column as a flat float64 array"""
+    return np.asarray(df[name], dtype=np.float64).reshape(-1)
+
+
+def _affine_scaler(scaler):
+    """Return (offset, factor) with scaler.transform(X) == (X - offset) * factor, or None"""
+    if isinstance(scaler, StandardScaler):
+        n = scaler.n_features_in_
+        offset = scaler.mean_ if scaler.with_mean else np.zeros(n)
+        factor = 1 / scaler.scale_ if scaler.with_std else np.ones(n)
+    elif isinstance(scaler, MinMaxScaler):
+        if getattr(scaler, 'clip', False):
+            # Clipping to feature_range is not affine; leave it to transform()
+            return None
+        offset = -scaler.min_ / scaler.scale_
+        factor = scaler.scale_
+    else:
+        return None
+    return offset.astype(np.float32), factor.astype(np.float32)
+
+
+def _row_predictor(model):
+    """Return a function predicting one scaled row without the estimator's input checks"""
+    if hasattr(model, 'get_booster'):  # XGBoost
+        booster = model.get_booster()
+        return lambda row: float(booster.inplace_predict(row)[0])
+    if hasattr(model, 'booster_'):  # LightGBM
+        booster = model.booster_
+        return lambda row: float(booster.predict(row)[0])
+    coef = getattr(model, 'coef_', None)
+    if coef is not None and np.ndim(coef) == 1:  # linear models
+        intercept = float(np.ravel(model.intercept_)[0])
+        return lambda row: float(row[0] @ coef) + intercept
+    return lambda row: float(model.predict(row)[0])
+
+
+# Persisted daily OHLCV window per ticker, so each run only downloads new bars
+OHLCV_HISTORY_PATH = os.path.join('data', '{ticker}_ohlcv.parquet')
+
+# Relative Close difference on re-downloaded bars that means Yahoo re-adjusted
+# the series (split or dividend); well below a typical quarterly dividend yield
+ADJUSTMENT_RTOL = 1e-5
+
+
+def _load_history(ticker):
+    """Read a ticker's persisted OHLCV window, or None when there is none"""
+    path = OHLCV_HISTORY_PATH.format(ticker=ticker)
+    try:
+        return pd.read_parquet(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"⚠ Ignoring unreadable OHLCV history {path}: {e}")
+        return None
+
+
+def _fetch_start(history, window_start):
+    """First date to download, or the window start when nothing is stored
+    
+    The download starts at the second-to-last stored bar: the last one may have
+    been partial, and the one before it is a completed bar to compare against
+    (see _adjustment_changed).
+    """
+    if history is None or history.empty:
+        return window_start
+    return max(history.index[max(len(history) - 2, 0)].to_pydatetime(), window_start)
+
+
+def _adjustment_changed(history, fresh):
+    """True when re-downloaded completed bars no longer match the stored ones
+    
+    Downloads are split/dividend adjusted, so after a corporate action Yahoo
+    rescales the whole series and the stored window is on a stale basis.
+    """
+    if history is None or fresh is None or fresh.empty or len(history) < 2:
+        return False
+    # The last stored bar may have been partial, so only earlier bars are compared
+    stored = history['Close'].iloc[:-1]
+    common = stored.index.intersection(fresh.index)
+    if common.empty:
+        return False
+    return not np.allclose(fresh.loc[common, 'Close'].to_numpy(dtype=np.float64),
+                           stored.loc[common].to_numpy(dtype=np.float64),
+                           rtol=ADJUSTMENT_RTOL, atol=0)
+
+
+def _merge_history(ticker, history, fresh, window_start):
+    """Merge new bars into the stored history, persist the window and return it"""
+    frames = [frame for frame in (history, fresh) if frame is not None and not frame.empty]
+    if not frames:
+        return None
+    
+    df = pd.concat(frames)
+    df = df[~df.index.duplicated(keep='last')].sort_index()
+    df = df[df.index >= pd.Timestamp(window_start.date())]
+    
+    path = OHLCV_HISTORY_PATH.format(ticker=ticker)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        df.to_parquet(tmp_path, compression='zstd')
+        os.replace(tmp_path, path)
+    except Exception as e:
+        print(f"⚠ Error writing OHLCV history: {e}")
+    return df
+
+
+# Trained artifacts per ticker, as written by the model-building notebook
+MODEL_DIR = 'models'
+ARTIFACT_SUFFIXES = ('_model.pkl', '_scaler.pkl', '_model_metadata.json')
+
+
+def _has_artifacts(ticker):
+    """True when a ticker's model, scaler and metadata all exist"""
+    return all(os.path.isfile(os.path.join(MODEL_DIR, ticker + suffix)) for suffix in ARTIFACT_SUFFIXES)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_artifacts(ticker):
+    """Unpickle a ticker's model, scaler and metadata once per process"""
+    model_path, scaler_path, metadata_path = (os.path.join(MODEL_DIR, ticker + suffix)
+                                              for suffix in ARTIFACT_SUFFIXES)
+    model = joblib.load(model_path, mmap_mode='r')
+    scaler = joblib.load(scaler_path, mmap_mode='r')
+    with open(metadata_path, 'rb') as f:
+        metadata = json_loads(f.read())
+    return model, scaler, metadata
+
+
+@functools.lru_cache(maxsize=4)
+def _load_subscribers_cached(path, mtime):
+    """Parse the legacy subscribers file once per modification time"""
+    with open(path, 'rb') as f:
+        return json_loads(f.read())
+
+
+@functools.lru_cache(maxsize=16)
+def _load_ticker_subscribers(path, mtime, ticker):
+    """Active subscribers of one ticker from the app's database, once per modification time"""
+    with closing(sqlite3.connect(f'file:{path}?mode=ro', uri=True)) as conn:
+        rows = conn.execute(
+            "SELECT email FROM subscriptions WHERE ticker = ? AND active = 1 ORDER BY email", (ticker,)
+        )
+        return tuple(email for (email,) in rows)
+
 
 class MarketMonitor:
-    def __init__(self):
-        self.model_path = 'models/model.pkl'
-        self.scaler_path = 'models/scaler.pkl'
-        self.metadata_path = 'models/model_metadata.json'
-        self.log_path = 'logs/predictions.log'
+    def __init__(self, ticker='AAPL'):
+        self.ticker = ticker
+        self.log_path = f'logs/{ticker}_predictions.log'
+        self.subscribers_db = 'data/subscribers.db'
         self.subscribers_path = 'data/subscribers.json'
         
         # Load model and scaler
         self.model = None
         self.scaler = None
         self.metadata = None
-        self.ticker = 'AAPL'  # Default ticker
+        self._scale = None
+        self._predict_row = None
         
     def load_model(self):
         """Load the trained model and scaler"""
         try:
-            self.model = joblib.load(self.model_path)
-            self.scaler = joblib.load(self.scaler_path)
+            self.model, self.scaler, self.metadata = _load_artifacts(self.ticker)
             
-            with open(self.metadata_path, 'r') as f:
-                self.metadata = json.load(f)
+            # Single-row fast paths for the scaler and model
+            self._scale = _affine_scaler(self.scaler)
+            self._predict_row = _row_predictor(self.model)
             
             print("✓ Model and scaler loaded successfully")
             print(f"  Model: {self.metadata['model_name']}")
@@ -47,75 +305,119 @@ class MarketMonitor:
             return False
     
     def fetch_latest_data(self, days=60):
-        """Fetch latest market data"""
+        """Fetch latest market data, downloading only bars newer than the stored history"""
         try:
+            # Imported on first fetch so runs on supplied data skip yfinance's import cost
+            import yfinance as yf
+            
             end_date = datetime.now()
-            start_date = end_date - timedelta(days=days)
+            window_start = end_date - timedelta(days=days)
+            history = _load_history(self.ticker)
             
-            print(f"\n📊 Fetching {self.ticker} data...")
-            df = yf.download(self.ticker, start=start_date, end=end_date, progress=False)
+            def download(start):
+                frame = yf.download(self.ticker, start=start, end=end_date,
+                                    progress=False, session=_yf_session())
+                # Recent yfinance versions return (Price, Ticker) columns even for one ticker
+                if isinstance(frame.columns, pd.MultiIndex):
+                    frame.columns = frame.columns.get_level_values(0)
+                return frame
             
-            if df.empty:
+            print(f"\n📊 Fetching {self.ticker} data...")
+            fresh = download(_fetch_start(history, window_start))
+            if _adjustment_changed(history, fresh):
+                print("⚠ Stored bars were re-adjusted (split or dividend), refetching the full window")
+                history = None
+                fresh = download(window_start)
+            
+            df = _merge_history(self.ticker, history, fresh, window_start)
+            if df is None:
                 print("✗ No data fetched")
                 return None
             
-            print(f"✓ Fetched {len(df)} days of data")
+            print(f"✓ Fetched {len(fresh)} new days ({len(df)} days of data)")
             return df
         except Exception as e:
             print(f"✗ Error fetching data: {e}")
             return None
     
-    def engineer_features(self, df):
-        """Create the same features used during training"""
+    @classmethod
+    def fetch_all(cls, tickers, days=60):
+        """Fetch latest market data for several tickers in one request"""
+        try:
+            import yfinance as yf
+            
+            end_date = datetime.now()
+            window_start = end_date - timedelta(days=days)
+            histories = {ticker: _load_history(ticker) for ticker in tickers}
+            start_date = min(_fetch_start(history, window_start) for history in histories.values())
+            
+            def download(symbols, start):
+                df = yf.download(list(symbols), start=start, end=end_date,
+                                 group_by='ticker', threads=True, progress=False,
+                                 session=_yf_session())
+                fresh = {}
+                for ticker in symbols:
+                    if ticker in df.columns.get_level_values(0):
+                        bars = df.xs(ticker, axis=1, level=0).dropna(how='all')
+                        if not bars.empty:
+                            fresh[ticker] = bars
+                return fresh
+            
+            print(f"\n📊 Fetching data for {len(tickers)} tickers...")
+            fresh = download(tickers, start_date)
+            
+            # Tickers whose stored window was re-adjusted are fetched again in full
+            stale = [ticker for ticker, bars in fresh.items()
+                     if _adjustment_changed(histories[ticker], bars)]
+            if stale:
+                print(f"⚠ Re-adjusted history for {', '.join(stale)}, refetching the full window")
+                for ticker in stale:
+                    # Without a full refetch the ticker falls back to its own download
+                    del fresh[ticker]
+                    histories[ticker] = None
+                fresh.update(download(stale, window_start))
+            
+            frames = {ticker: _merge_history(ticker, histories[ticker], bars, window_start)
+                      for ticker, bars in fresh.items()}
+            
+            print(f"✓ Fetched data for {len(frames)}/{len(tickers)} tickers")
+            return frames
+        except Exception as e:
+            print(f"✗ Error fetching data: {e}")
+            return {}
+    
+    def engineer_features(self, df, n_tail=1):
+        """Create the same features used during training
+        
+        Only the last ``n_tail`` rows are returned (all rows when ``n_tail`` is None),
+        since prediction consumes just the latest one.
+        """
         try:
-            df_features = df.copy()
-            
-            # Moving Averages
-            df_features['MA_5'] = df_features['Close'].rolling(window=5).mean()
-            df_features['MA_10'] = df_features['Close'].rolling(window=10).mean()
-            df_features['MA_20'] = df_features['Close'].rolling(window=20).mean()
-            df_features['MA_50'] = df_features['Close'].rolling(window=50).mean()
-            
-            # Exponential Moving Averages
-            df_features['EMA_12'] = df_features['Close'].ewm(span=12, adjust=False).mean()
-            df_features['EMA_26'] = df_features['Close'].ewm(span=26, adjust=False).mean()
-            
-            # MACD
-            df_features['MACD'] = df_features['EMA_12'] - df_features['EMA_26']
-            df_features['MACD_Signal'] = df_features['MACD'].ewm(span=9, adjust=False).mean()
-            
-            # RSI
-            delta = df_features['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            df_features['RSI'] = 100 - (100 / (1 + rs))
-            
-            # Bollinger Bands
-            df_features['BB_Middle'] = df_features['Close'].rolling(window=20).mean()
-            bb_std = df_features['Close'].rolling(window=20).std()
-            df_features['BB_Upper'] = df_features['BB_Middle'] + (bb_std * 2)
-            df_features['BB_Lower'] = df_features['BB_Middle'] - (bb_std * 2)
-            
-            # Price-based features
-            df_features['Daily_Return'] = df_features['Close'].pct_change()
-            df_features['Price_Range'] = df_features['High'] - df_features['Low']
-            df_features['Price_Change'] = df_features['Close'] - df_features['Open']
-            
-            # Volume features
-            df_features['Volume_MA_5'] = df_features['Volume'].rolling(window=5).mean()
-            df_features['Volume_Ratio'] = df_features['Volume'] / df_features['Volume_MA_5']
-            
-            # Volatility
-            df_features['Volatility'] = df_features['Daily_Return'].rolling(window=20).std()
-            
-            # Lag features
-            for i in [1, 2, 3, 5, 7]:
-                df_features[f'Close_Lag_{i}'] = df_features['Close'].shift(i)
-                df_features[f'Volume_Lag_{i}'] = df_features['Volume'].shift(i)
-            
-            # Remove NaN rows
-            df_features = df_features.dropna()
+            close = _column(df, 'Close')
+            volume = _column(df, 'Volume')
+            high = _column(df, 'High')
+            low = _column(df, 'Low')
+            open_ = _column(df, 'Open')
+            
+            # Emit only the trailing rows; the full history just primes the rolling
+            # windows and EMA recursions. For the single row prediction needs,
+            # each indicator is reduced straight to its last value.
+            if n_tail == 1:
+                latest = compute_latest_features(open_, high, low, close, volume)
+                features = {name: np.array([value]) for name, value in latest.items()}
+                tail = slice(-1, None)
+            else:
+                tail = slice(-n_tail, None) if n_tail else slice(None)
+                features = {name: values[tail] for name, values in
+                            compute_features(open_, high, low, close, volume).items()}
+            
+            # Rows with NaN features are skipped. Features are computed in float64
+            # (the EMA recursion accumulates error) but handed on as float32.
+            valid = ~np.isnan(np.column_stack(list(features.values()))).any(axis=1)
+            columns = {col: df[col].to_numpy()[tail][valid] for col in df.columns}
+            columns.update((name, values[valid].astype(np.float32))
+                           for name, values in features.items())
+            df_features = pd.DataFrame(columns, index=df.index[tail][valid])
             
             print(f"✓ Features engineered: {len(df_features.columns)} columns")
             return df_features
@@ -129,19 +431,21 @@ class MarketMonitor:
             # Get the feature columns from metadata
             feature_cols = self.metadata['features']
             
-            # Select latest row and required features
-            latest_data = df_features[feature_cols].iloc[-1:].copy()
+            # Select the latest row straight into a float32 vector
+            row = df_features[feature_cols].iloc[-1].to_numpy(dtype=np.float32)
             
-            # Replace infinite values
-            latest_data = latest_data.replace([np.inf, -np.inf], np.nan)
-            
-            # Check for NaN
-            if latest_data.isnull().any().any():
+            # Replace infinite / NaN values
+            if not np.isfinite(row).all():
                 print("⚠ Warning: NaN values found in input data")
-                latest_data = latest_data.fillna(method='ffill').fillna(0)
+                np.nan_to_num(row, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+            latest_data = dict(zip(feature_cols, row.tolist()))
             
             # Scale features
-            latest_scaled = self.scaler.transform(latest_data)
+            if self._scale is not None:
+                offset, factor = self._scale
+                latest_scaled = ((row - offset) * factor)[np.newaxis, :]
+            else:
+                latest_scaled = self.scaler.transform(pd.DataFrame([row], columns=feature_cols))
             
             print(f"✓ Input prepared: {latest_scaled.shape}")
             return latest_scaled, latest_data
@@ -152,7 +456,7 @@ class MarketMonitor:
     def make_prediction(self, input_data):
         """Make price prediction"""
         try:
-            prediction = self.model.predict(input_data)[0]
+            prediction = self._predict_row(input_data)
             print(f"✓ Prediction made: ${prediction:.2f}")
             return prediction
         except Exception as e:
@@ -179,27 +483,58 @@ class MarketMonitor:
                 'predicted_price': float(predicted_price),
                 'price_change': float(price_change),
                 'price_change_pct': float(price_change_pct),
-                'rsi': float(latest_data['RSI'].iloc[0]) if 'RSI' in latest_data.columns else None,
-                'macd': float(latest_data['MACD'].iloc[0]) if 'MACD' in latest_data.columns else None
+                'rsi': latest_data.get('RSI'),
+                'macd': latest_data.get('MACD')
             }
             
             # Append to log file
-            with open(self.log_path, 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
+            with open(self.log_path, 'ab') as f:
+                f.write(_json_line(log_entry))
             
             print(f"✓ Results logged to {self.log_path}")
+            self.append_parquet_log(log_entry)
             return log_entry
         except Exception as e:
             print(f"✗ Error logging results: {e}")
             return None
     
+    def append_parquet_log(self, log_entry):
+        """Append a log entry to the ticker's daily Parquet partition"""
+        try:
+            partition_dir = os.path.join('logs', self.ticker)
+            os.makedirs(partition_dir, exist_ok=True)
+            
+            timestamp = datetime.strptime(log_entry['timestamp'], "%Y-%m-%d %H:%M:%S")
+            path = os.path.join(partition_dir, f"{timestamp:%Y-%m-%d}.parquet")
+            
+            table = pa.Table.from_pylist([{**log_entry, 'timestamp': timestamp}], schema=LOG_SCHEMA)
+            if os.path.exists(path):
+                # Same-day re-run: keep the earlier rows of that day
+                table = pa.concat_tables([pq.read_table(path, schema=LOG_SCHEMA), table])
+            
+            # Dot-prefixed temp file is ignored by dataset readers until renamed
+            tmp_path = os.path.join(partition_dir, f".{timestamp:%Y-%m-%d}.parquet.tmp")
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+            
+            print(f"✓ Results appended to {path}")
+        except Exception as e:
+            print(f"⚠ Error writing Parquet log: {e}")
+    
     def load_subscribers(self):
         """Load email subscribers"""
         try:
+            if os.path.exists(self.subscribers_db):
+                mtime = os.path.getmtime(self.subscribers_db)
+                return list(_load_ticker_subscribers(self.subscribers_db, mtime, self.ticker))
+            # Not yet migrated by the app: read the JSON file it is created from
             if os.path.exists(self.subscribers_path):
-                with open(self.subscribers_path, 'r') as f:
-                    subscribers = json.load(f)
-                return subscribers.get('emails', [])
+                mtime = os.path.getmtime(self.subscribers_path)
+                emails = _load_subscribers_cached(self.subscribers_path, mtime).get('emails', [])
+                # The app stores subscribers per ticker; older files hold one flat list
+                if isinstance(emails, dict):
+                    return emails.get(self.ticker, [])
+                return emails
             return []
         except Exception as e:
             print(f"⚠ Error loading subscribers: {e}")
@@ -224,81 +559,81 @@ class MarketMonitor:
                 print("⚠ Email credentials not configured")
                 return
             
+            # Mail modules are only needed once credentials are configured
+            import smtplib
+            from email.mime.multipart import MIMEMultipart
+            from email.mime.text import MIMEText
+            
             # Create email content
             subject = f"📊 Daily Market Monitor - {self.ticker}"
             
-            body = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif;">
-                <h2>Daily Market Monitor Report</h2>
-                <p><strong>Ticker:</strong> {self.ticker}</p>
-                <p><strong>Date:</strong> {log_entry['timestamp']}</p>
-                <hr>
-                <h3>Price Analysis</h3>
-                <p><strong>Current Price:</strong> ${log_entry['current_price']:.2f}</p>
-                <p><strong>Predicted Price (Next Day):</strong> ${log_entry['predicted_price']:.2f}</p>
-                <p><strong>Expected Change:</strong> ${log_entry['price_change']:.2f} ({log_entry['price_change_pct']:.2f}%)</p>
-                <hr>
-                <h3>Technical Indicators</h3>
-                <p><strong>RSI:</strong> {log_entry.get('rsi', 'N/A'):.2f}</p>
-                <p><strong>MACD:</strong> {log_entry.get('macd', 'N/A'):.2f}</p>
-                <hr>
-                <p style="color: gray; font-size: 12px;">
-                    This is an automated report. Past performance does not guarantee future results.
-                </p>
-            </body>
-            </html>
-            """
-            
-            # Send to each subscriber
-            for email in subscribers:
-                msg = MIMEMultipart('alternative')
-                msg['Subject'] = subject
-                msg['From'] = sender_email
-                msg['To'] = email
-                
-                msg.attach(MIMEText(body, 'html'))
-                
-                with smtplib.SMTP(smtp_server, smtp_port) as server:
-                    server.starttls()
-                    server.login(sender_email, sender_password)
-                    server.send_message(msg)
+            body = EMAIL_TEMPLATE.substitute(
+                ticker=self.ticker,
+                timestamp=log_entry['timestamp'],
+                current_price=f"{log_entry['current_price']:.2f}",
+                predicted_price=f"{log_entry['predicted_price']:.2f}",
+                price_change=f"{log_entry['price_change']:.2f}",
+                price_change_pct=f"{log_entry['price_change_pct']:.2f}",
+                rsi=_fmt_indicator(log_entry.get('rsi')),
+                macd=_fmt_indicator(log_entry.get('macd')),
+            )
+            
+            # Subscribers are blind-copied: the visible To is the sender, and the
+            # message is serialized once for every envelope
+            msg = MIMEMultipart('alternative')
+            msg['Subject'] = subject
+            msg['From'] = sender_email
+            msg['To'] = sender_email
+            msg.attach(MIMEText(body, 'html'))
+            payload = msg.as_bytes()
+            
+            # One TLS session and login for the whole mailout, one envelope per batch
+            with smtplib.SMTP(smtp_server, smtp_port) as server:
+                server.starttls()
+                server.login(sender_email, sender_password)
+                for start in range(0, len(subscribers), EMAIL_BATCH_SIZE):
+                    server.sendmail(sender_email, subscribers[start:start + EMAIL_BATCH_SIZE], payload)
             
             print(f"✓ Emails sent to {len(subscribers)} subscribers")
         except Exception as e:
             print(f"✗ Error sending emails: {e}")
     
-    def run_pipeline(self):
-        """Run the complete monitoring pipeline"""
+    def run_pipeline(self, df=None):
+        """Run the complete monitoring pipeline
+        
+        ``df`` is market data already fetched for this ticker (see fetch_all);
+        when omitted it is downloaded here.
+        """
         print("="*70)
-        print("MARKET MONITOR - Daily Pipeline")
+        print(f"MARKET MONITOR - Daily Pipeline ({self.ticker})")
         print("="*70)
         print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print()
         
         # Step 1: Load model
         if not self.load_model():
-            sys.exit(1)
+            return False
         
         # Step 2: Fetch data
-        df = self.fetch_latest_data()
         if df is None:
-            sys.exit(1)
+            df = self.fetch_latest_data()
+        if df is None:
+            return False
         
         # Step 3: Engineer features
         df_features = self.engineer_features(df)
         if df_features is None:
-            sys.exit(1)
+            return False
         
         # Step 4: Prepare input
         input_data, latest_data = self.prepare_input(df_features)
         if input_data is None:
-            sys.exit(1)
+            return False
         
         # Step 5: Make prediction
         predicted_price = self.make_prediction(input_data)
         if predicted_price is None:
-            sys.exit(1)
+            return False
         
         # Get current price
         current_price = df['Close'].iloc[-1]
@@ -306,7 +641,7 @@ class MarketMonitor:
         # Step 6: Log results
         log_entry = self.log_result(current_price, predicted_price, latest_data)
         if log_entry is None:
-            sys.exit(1)
+            return False
         
         # Step 7: Send email alerts
         self.send_email_alert(log_entry)
@@ -322,7 +657,64 @@ class MarketMonitor:
         print("="*70)
         print("✓ Pipeline completed successfully!")
         print("="*70)
+        return True
+
+
+def run_ticker(ticker, df=None):
+    """Run the pipeline for one ticker (module-level so worker processes can pickle it)"""
+    return MarketMonitor(ticker).run_pipeline(df)
+
+
+def run_all_tickers(tickers=_TICKER_KEYS, parallel=False):
+    """Run the pipeline for several tickers, serially in one process or across processes
+    
+    Tickers without trained artifacts in MODEL_DIR are skipped. Data is
+    downloaded once, up front, in one batched request. Serial runs reuse the
+    loaded artifacts and keep each ticker's output together in the log;
+    parallel runs overlap model loading and inference on separate cores.
+    """
+    requested = list(tickers)
+    tickers = [ticker for ticker in requested if _has_artifacts(ticker)]
+    skipped = [ticker for ticker in requested if ticker not in tickers]
+    if skipped:
+        print(f"ℹ Skipping tickers without a trained model in {MODEL_DIR}/: {', '.join(skipped)}")
+    if not tickers:
+        # Nothing trained at all is a setup error, not a quiet success
+        if requested:
+            print("✗ No requested ticker has a trained model")
+        return requested
+    
+    # One batched download; tickers missing from it fall back to their own fetch
+    frames = MarketMonitor.fetch_all(tickers)
+    slices = [frames.get(ticker) for ticker in tickers]
+    
+    if parallel:
+        with ProcessPoolExecutor(max_workers=min(len(tickers), os.cpu_count() or 1)) as executor:
+            results = list(executor.map(run_ticker, tickers, slices))
+    else:
+        results = [run_ticker(ticker, df) for ticker, df in zip(tickers, slices)]
+    
+    failed = [ticker for ticker, ok in zip(tickers, results) if not ok]
+    if failed:
+        print(f"✗ Pipeline failed for: {', '.join(failed)}")
+    return failed
+
 
 if __name__ == "__main__":
-    monitor = MarketMonitor()
-    monitor.run_pipeline()
+    # Usage: python monitor.py [TICKER | --all [--parallel] | --list]
+    args = sys.argv[1:]
+    
+    if '--list' in args:
+        for ticker in _TICKER_KEYS:
+            print(f"{ticker:<6} {AVAILABLE_TICKERS[ticker]}")
+        sys.exit(0)
+    
+    if '--all' in args or '--parallel' in args:
+        sys.exit(1 if run_all_tickers(parallel='--parallel' in args) else 0)
+    
+    ticker = (args[0] if args else os.getenv('TICKER', 'AAPL')).upper()
+    if ticker not in AVAILABLE_TICKERS:
+        print(f"✗ Unknown ticker '{ticker}'. Available: {', '.join(_TICKER_KEYS)}")
+        sys.exit(1)
+    
+    sys.exit(0 if run_ticker(ticker) else 1)
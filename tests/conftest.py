@@ -0,0 +1,38 @@
+"""
+Shared test setup: the monitor and the app are scripts, not packages, so their
+directories go on the import path. Both resolve data/, logs/ and models/
+relative to the working directory, so tests run inside a temporary one.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [os.path.join(ROOT, 'scripts'), os.path.join(ROOT, 'Streamlit_app')]
+
+
+def make_ohlcv(n=80, end=None, seed=0, scale=1.0):
+    """Synthetic daily OHLCV bars shaped like a yfinance download, ending today by default"""
+    rng = np.random.default_rng(seed)
+    close = 150 + np.cumsum(rng.normal(0, 1.5, n))
+    open_ = close + rng.normal(0, 0.5, n)
+    df = pd.DataFrame({
+        'Open': open_,
+        'High': np.maximum(open_, close) + rng.uniform(0, 1, n),
+        'Low': np.minimum(open_, close) - rng.uniform(0, 1, n),
+        'Close': close,
+        'Volume': rng.integers(1_000_000, 5_000_000, n).astype(np.float64),
+    }, index=pd.bdate_range(end=end or pd.Timestamp.today().normalize(), periods=n, name='Date'))
+    df[['Open', 'High', 'Low', 'Close']] *= scale
+    return df
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run the test from an empty temporary working directory"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
@@ -0,0 +1,136 @@
+"""Tests for the dashboard's log and subscription storage (Streamlit_app/app.py)"""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+import streamlit as st
+
+import monitor
+
+
+@pytest.fixture
+def app(workdir):
+    """The app module, run from an empty working directory with cold caches"""
+    import app
+    app.ensure_dirs()
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    yield app
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+
+def log_entry(timestamp, price, ticker='AAPL'):
+    return {'timestamp': timestamp, 'ticker': ticker, 'current_price': price,
+            'predicted_price': price + 1.0, 'price_change': 1.0,
+            'price_change_pct': 100.0 / price, 'rsi': 50.0, 'macd': 0.1}
+
+
+def write_jsonl(entries, ticker='AAPL'):
+    with open(f'logs/{ticker}_predictions.log', 'a') as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + '\n')
+
+
+def write_partition(entries, ticker='AAPL'):
+    """Write entries to their daily partitions, as the monitor's append_parquet_log does"""
+    os.makedirs(f'logs/{ticker}', exist_ok=True)
+    df = pd.DataFrame(entries)
+    df['timestamp'] = pd.to_datetime(df['timestamp'])
+    for day, rows in df.groupby(df['timestamp'].dt.date):
+        rows.to_parquet(f'logs/{ticker}/{day:%Y-%m-%d}.parquet', index=False)
+
+
+def test_load_logs_reads_jsonl_without_partitions(app):
+    write_jsonl([log_entry('2024-01-02 09:00:00', 100.0), log_entry('2024-01-03 09:00:00', 101.0)])
+
+    logs = app.load_logs('AAPL')
+    assert logs['current_price'].tolist() == [100.0, 101.0]
+
+
+def test_load_logs_keeps_jsonl_history_older_than_partitions(app):
+    # Entries from before the partitions existed are only in the JSONL log; later
+    # ones were written to both
+    old = [log_entry('2024-01-02 09:00:00', 100.0), log_entry('2024-01-03 09:00:00', 101.0)]
+    new = [log_entry('2024-01-04 09:00:00', 102.0), log_entry('2024-01-05 09:00:00', 103.0)]
+    write_jsonl(old + new)
+    write_partition(new)
+
+    logs = app.load_logs('AAPL')
+    assert list(logs.columns) == app.LOG_COLUMNS
+    assert logs['current_price'].tolist() == [100.0, 101.0, 102.0, 103.0]
+    assert logs['timestamp'].is_monotonic_increasing
+
+    assert app.load_latest_log('AAPL', n=3)['current_price'].tolist() == [101.0, 102.0, 103.0]
+
+
+def test_load_logs_reads_partitions_without_jsonl(app):
+    write_partition([log_entry('2024-01-04 09:00:00', 102.0), log_entry('2024-01-05 09:00:00', 103.0)])
+
+    assert app.load_logs('AAPL')['current_price'].tolist() == [102.0, 103.0]
+    assert app.load_latest_log('AAPL')['current_price'].tolist() == [103.0]
+
+
+def test_incremental_read_waits_for_a_partial_last_line(app):
+    path = 'logs/AAPL_predictions.log'
+    write_jsonl([log_entry('2024-01-02 09:00:00', 100.0), log_entry('2024-01-03 09:00:00', 101.0)])
+    third = json.dumps(log_entry('2024-01-04 09:00:00', 102.0)) + '\n'
+    with open(path, 'a') as f:
+        f.write(third[:20])
+
+    assert app._read_log_incremental(path, None)['current_price'].tolist() == [100.0, 101.0]
+
+    # A new process reuses the snapshot but still resumes at the start of the partial line
+    st.cache_resource.clear()
+    assert app._read_log_incremental(path, None)['current_price'].tolist() == [100.0, 101.0]
+
+    with open(path, 'a') as f:
+        f.write(third[20:])
+    write_jsonl([log_entry('2024-01-05 09:00:00', 103.0)])
+
+    logs = app._read_log_incremental(path, None)
+    assert logs['current_price'].tolist() == [100.0, 101.0, 102.0, 103.0]
+
+
+def test_incremental_read_restarts_on_a_replaced_log(app):
+    path = 'logs/AAPL_predictions.log'
+    write_jsonl([log_entry('2024-01-02 09:00:00', 100.0), log_entry('2024-01-03 09:00:00', 101.0)])
+    assert app._read_log_incremental(path, None)['current_price'].tolist() == [100.0, 101.0]
+
+    # Rotated: a new file that has already grown past the old offset
+    rotated = [log_entry(f'2024-02-{day:02d} 09:00:00', 200.0 + day) for day in range(1, 6)]
+    with open('logs/new.log', 'w') as f:
+        f.writelines(json.dumps(entry) + '\n' for entry in rotated)
+    os.replace('logs/new.log', path)
+
+    logs = app._read_log_incremental(path, None)
+    assert logs['current_price'].tolist() == [201.0, 202.0, 203.0, 204.0, 205.0]
+
+
+def test_first_subscription_write_migrates_the_json_file(app):
+    with open(app.SUBSCRIBERS_PATH, 'w') as f:
+        json.dump({'emails': {'AAPL': ['a@x.com', 'b@x.com'], 'MSFT': ['a@x.com']}}, f)
+    assert app.load_subscribers()['emails']['AAPL'] == {'a@x.com', 'b@x.com'}
+
+    # Changing one email's tickers imports everyone else's from the JSON file
+    assert app.update_subscription('b@x.com', ['TSLA'])
+    emails = app.load_subscribers()['emails']
+    assert emails['AAPL'] == {'a@x.com'}
+    assert emails['MSFT'] == {'a@x.com'}
+    assert emails['TSLA'] == {'b@x.com'}
+
+    # The database is authoritative from now on, for the app and the monitor
+    os.remove(app.SUBSCRIBERS_PATH)
+    assert app.unsubscribe_all('a@x.com') == 2
+    assert app.load_subscribers()['emails']['AAPL'] == set()
+    assert monitor.MarketMonitor('AAPL').load_subscribers() == []
+    assert monitor.MarketMonitor('TSLA').load_subscribers() == ['b@x.com']
+
+
+def test_monitor_reads_the_json_file_before_migration(app):
+    with open(app.SUBSCRIBERS_PATH, 'w') as f:
+        json.dump({'emails': {'AAPL': ['a@x.com']}}, f)
+    assert monitor.MarketMonitor('AAPL').load_subscribers() == ['a@x.com']
+    assert not os.path.exists(app.SUBSCRIBERS_DB)
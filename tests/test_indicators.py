@@ -0,0 +1,130 @@
+"""Tests for the indicator kernels (scripts/indicators.py) against the training definitions"""
+
+import importlib.util
+import os
+import sys
+
+import numpy as np
+import pytest
+
+from conftest import ROOT, make_ohlcv
+
+INDICATORS_PATH = os.path.join(ROOT, 'scripts', 'indicators.py')
+OPTIONAL_PACKAGES = ['numba', 'bottleneck']
+
+
+def training_features(df):
+    """The feature columns as computed with pandas in Notebook/01_data_collection_and_eda.ipynb"""
+    df = df.copy()
+    for window in [5, 10, 20, 50]:
+        df[f'MA_{window}'] = df['Close'].rolling(window=window).mean()
+
+    df['EMA_12'] = df['Close'].ewm(span=12, adjust=False).mean()
+    df['EMA_26'] = df['Close'].ewm(span=26, adjust=False).mean()
+    df['MACD'] = df['EMA_12'] - df['EMA_26']
+    df['MACD_Signal'] = df['MACD'].ewm(span=9, adjust=False).mean()
+
+    delta = df['Close'].diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    df['RSI'] = 100 - (100 / (1 + gain / loss))
+
+    df['BB_Middle'] = df['Close'].rolling(window=20).mean()
+    bb_std = df['Close'].rolling(window=20).std()
+    df['BB_Upper'] = df['BB_Middle'] + (bb_std * 2)
+    df['BB_Lower'] = df['BB_Middle'] - (bb_std * 2)
+
+    df['Daily_Return'] = df['Close'].pct_change()
+    df['Price_Range'] = df['High'] - df['Low']
+    df['Price_Change'] = df['Close'] - df['Open']
+    df['Volume_MA_5'] = df['Volume'].rolling(window=5).mean()
+    df['Volume_Ratio'] = df['Volume'] / df['Volume_MA_5']
+    df['Volatility'] = df['Daily_Return'].rolling(window=20).std()
+
+    for i in [1, 2, 3, 5, 7]:
+        df[f'Close_Lag_{i}'] = df['Close'].shift(i)
+        df[f'Volume_Lag_{i}'] = df['Volume'].shift(i)
+    return df
+
+
+def load_indicators(monkeypatch, available=()):
+    """A private copy of the indicators module that sees only the given optional packages"""
+    for name in OPTIONAL_PACKAGES:
+        if name not in available:
+            monkeypatch.setitem(sys.modules, name, None)
+    spec = importlib.util.spec_from_file_location('indicators', INDICATORS_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered under its real name, which numba's on-disk cache records
+    monkeypatch.setitem(sys.modules, 'indicators', module)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(params=['numpy', 'bottleneck', 'numba'])
+def indicators(request, monkeypatch):
+    """The indicators module on each of its kernel paths"""
+    if request.param == 'numpy':
+        return load_indicators(monkeypatch)
+    pytest.importorskip(request.param)
+    return load_indicators(monkeypatch, [request.param])
+
+
+def columns(df):
+    return [df[name].to_numpy(np.float64) for name in ['Open', 'High', 'Low', 'Close', 'Volume']]
+
+
+def test_kernel_path_selection(indicators, request):
+    path = request.node.callspec.params['indicators']
+    assert (indicators.njit is not None) == (path == 'numba')
+    assert (indicators.bn is not None) == (path == 'bottleneck')
+
+
+@pytest.mark.parametrize('n', [3, 20, 80])
+def test_rolling_windows_match_pandas(indicators, n):
+    close = make_ohlcv(n)['Close']
+    windows = (5, 10, 20, 50)
+    for window, values in zip(windows, indicators.rolling_means(close.to_numpy(), windows)):
+        expected = close.rolling(window).mean().to_numpy()
+        np.testing.assert_allclose(values, expected, rtol=1e-9, equal_nan=True, err_msg=f'{window}')
+        np.testing.assert_allclose(indicators.rolling_mean(close.to_numpy(), window), expected,
+                                   rtol=1e-9, equal_nan=True, err_msg=f'{window}')
+    np.testing.assert_allclose(indicators.rolling_std(close.to_numpy(), 20),
+                               close.rolling(20).std().to_numpy(), rtol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize('n', [1, 10, 30, 80])
+def test_compute_features_matches_training(indicators, n):
+    df = make_ohlcv(n)
+    expected = training_features(df)
+    features = indicators.compute_features(*columns(df))
+    for name, values in features.items():
+        np.testing.assert_allclose(values, expected[name].to_numpy(), rtol=1e-9, atol=1e-9,
+                                   equal_nan=True, err_msg=name)
+
+
+def test_rsi_without_losses_matches_training(indicators):
+    # No losses in the window: pandas divides by zero and gets RSI 100
+    df = make_ohlcv(30)
+    df['Close'] = np.linspace(100, 130, 30)
+    features = indicators.compute_features(*columns(df))
+    np.testing.assert_allclose(features['RSI'], training_features(df)['RSI'].to_numpy(), equal_nan=True)
+
+
+def test_ema_carries_nan_like_pandas(indicators):
+    # Unlike pandas, the recursion does not skip a missing close: it stays NaN from there on
+    close = make_ohlcv(30)['Close']
+    close.iloc[10] = np.nan
+    expected = close.ewm(span=12, adjust=False).mean().to_numpy(copy=True)
+    expected[10:] = np.nan
+    np.testing.assert_allclose(indicators.ema(close.to_numpy(), 12), expected, equal_nan=True)
+
+
+@pytest.mark.parametrize('n', [1, 5, 14, 15, 16, 20, 21, 50, 80])
+def test_latest_features_match_last_row(indicators, n):
+    arrays = columns(make_ohlcv(n))
+    full = indicators.compute_features(*arrays)
+    latest = indicators.compute_latest_features(*arrays)
+    assert list(latest) == list(full)
+    for name, values in full.items():
+        np.testing.assert_allclose(latest[name], values[-1], rtol=1e-9, atol=1e-9,
+                                   equal_nan=True, err_msg=name)
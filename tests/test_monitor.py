@@ -0,0 +1,150 @@
+"""Tests for the monitor's data handling (scripts/monitor.py)"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+import yfinance
+from sklearn.preprocessing import MinMaxScaler, StandardScaler
+
+import monitor
+from conftest import make_ohlcv
+
+
+class FakeDownload:
+    """Stand-in for yf.download serving bars of a mutable market frame"""
+
+    def __init__(self, market):
+        self.market = market
+        self.starts = []
+
+    def __call__(self, tickers, start=None, end=None, **kwargs):
+        self.starts.append(pd.Timestamp(start))
+        index = self.market.index
+        return self.market[(index >= pd.Timestamp(start).normalize()) & (index < pd.Timestamp(end))].copy()
+
+
+@pytest.fixture
+def fake_download(workdir, monkeypatch):
+    fake = FakeDownload(None)
+    monkeypatch.setattr(yfinance, 'download', fake)
+    return fake
+
+
+def test_merge_history_dedupes_trims_and_persists(workdir):
+    bars = make_ohlcv(30)
+    window_start = (bars.index[5] + timedelta(hours=9)).to_pydatetime()
+
+    # The overlapping bar comes back revised; the fresh copy wins
+    fresh = bars.iloc[-3:].copy()
+    fresh.loc[fresh.index[0], 'Close'] += 1.0
+    merged = monitor._merge_history('AAPL', bars.iloc[:-2], fresh, window_start)
+
+    assert merged.index.is_unique and merged.index.is_monotonic_increasing
+    assert merged.index[0] == bars.index[5]
+    assert merged.index[-1] == bars.index[-1]
+    assert merged.loc[fresh.index[0], 'Close'] == fresh['Close'].iloc[0]
+    pd.testing.assert_frame_equal(monitor._load_history('AAPL'), merged, check_freq=False)
+
+
+def test_fetch_start_overlaps_a_completed_bar():
+    bars = make_ohlcv(10)
+    window_start = datetime(2000, 1, 1)
+    assert monitor._fetch_start(None, window_start) == window_start
+    assert monitor._fetch_start(bars, window_start) == bars.index[-2].to_pydatetime()
+
+
+def test_incremental_fetch_downloads_only_new_bars(fake_download):
+    market = make_ohlcv(80)
+    fake_download.market = market.iloc[:-1]
+    monitor.MarketMonitor('AAPL').fetch_latest_data()
+
+    fake_download.market = market
+    df = monitor.MarketMonitor('AAPL').fetch_latest_data()
+
+    assert len(fake_download.starts) == 2
+    assert fake_download.starts[1] == market.index[-3]
+    assert df.index[-1] == market.index[-1]
+    np.testing.assert_allclose(df['Close'], market.loc[df.index, 'Close'])
+
+
+def test_split_refetches_the_full_window(fake_download):
+    market = make_ohlcv(80)
+    fake_download.market = market.iloc[:-1]
+    monitor.MarketMonitor('AAPL').fetch_latest_data()
+
+    # A 2:1 split: Yahoo rescales the whole adjusted series, stored bars included
+    split = market.copy()
+    split[['Open', 'High', 'Low', 'Close']] /= 2
+    fake_download.market = split
+    df = monitor.MarketMonitor('AAPL').fetch_latest_data()
+
+    assert len(fake_download.starts) == 3
+    assert fake_download.starts[2] < split.index[-40]
+    np.testing.assert_allclose(df['Close'], split.loc[df.index, 'Close'])
+    np.testing.assert_allclose(monitor._load_history('AAPL')['Close'], split.loc[df.index, 'Close'])
+
+
+def test_adjustment_check_ignores_a_revised_last_bar():
+    history = make_ohlcv(10)
+    fresh = history.iloc[-2:].copy()
+    fresh.loc[fresh.index[-1], 'Close'] *= 1.01
+    assert not monitor._adjustment_changed(history, fresh)
+
+    fresh.loc[fresh.index[0], 'Close'] *= 0.995
+    assert monitor._adjustment_changed(history, fresh)
+
+
+def test_run_all_tickers_skips_untrained(workdir, monkeypatch):
+    (workdir / 'models').mkdir()
+    for suffix in monitor.ARTIFACT_SUFFIXES:
+        (workdir / 'models' / f'AAPL{suffix}').write_bytes(b'')
+    ran = []
+    monkeypatch.setattr(monitor.MarketMonitor, 'fetch_all', classmethod(lambda cls, tickers, days=60: {}))
+    monkeypatch.setattr(monitor, 'run_ticker', lambda ticker, df=None: ran.append(ticker) or True)
+
+    assert monitor.run_all_tickers(['AAPL', 'MSFT']) == []
+    assert ran == ['AAPL']
+
+    # With nothing trained the run fails rather than passing vacuously
+    assert monitor.run_all_tickers(['MSFT']) == ['MSFT']
+
+
+@pytest.mark.parametrize('scaler', [StandardScaler(), StandardScaler(with_mean=False), MinMaxScaler()])
+def test_affine_scaler_matches_transform(scaler):
+    rng = np.random.default_rng(0)
+    scaler.fit(rng.normal(100, 20, (50, 4)))
+    row = rng.normal(100, 40, 4)
+
+    offset, factor = monitor._affine_scaler(scaler)
+    np.testing.assert_allclose((row - offset) * factor, scaler.transform(row[np.newaxis, :])[0], rtol=1e-5)
+
+
+def test_affine_scaler_leaves_clipping_to_transform():
+    scaler = MinMaxScaler(clip=True).fit(np.arange(10.0).reshape(-1, 1))
+    assert monitor._affine_scaler(scaler) is None
+
+
+def test_run_all_tickers_runs_serially_after_one_download(workdir, monkeypatch):
+    (workdir / 'models').mkdir()
+    for ticker in ['AAPL', 'MSFT']:
+        for suffix in monitor.ARTIFACT_SUFFIXES:
+            (workdir / 'models' / f'{ticker}{suffix}').write_bytes(b'')
+    calls = []
+    monkeypatch.setattr(monitor.MarketMonitor, 'fetch_all',
+                        classmethod(lambda cls, tickers, days=60: calls.append(('fetch', tickers)) or {}))
+    monkeypatch.setattr(monitor, 'run_ticker', lambda ticker, df=None: calls.append(('run', ticker)) or True)
+
+    assert monitor.run_all_tickers(['AAPL', 'MSFT']) == []
+    assert calls == [('fetch', ['AAPL', 'MSFT']), ('run', 'AAPL'), ('run', 'MSFT')]
+
+
+@pytest.mark.parametrize('version', [None, (0, 2, 40)])
+def test_yf_session_left_to_older_yfinance(monkeypatch, version):
+    monkeypatch.setattr(monitor, '_yfinance_version', lambda: version)
+    monitor._yf_session.cache_clear()
+    try:
+        assert monitor._yf_session() is None
+    finally:
+        monitor._yf_session.cache_clear()